@@ -5,22 +5,154 @@ Django project analyzer - extracts models, serializers, and views information
 import os
 import sys
 import inspect
+import functools
+import json
+import logging
 import importlib
-from typing import Dict, List, Any, Optional
+import importlib.util
+import operator
+import pkgutil
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Any, Optional, TextIO, Tuple
 from django.apps import apps
 from django.db import models
 from django.conf import settings
+from django.utils.functional import Promise
+
+logger = logging.getLogger(__name__)
+
+_cleandoc = inspect.cleandoc
+
+# Upper bound on threads used to analyze apps concurrently
+MAX_WORKERS = 8
+
+# Field attributes documented for every model field, fetched in one C call
+_FIELD_ATTRS = operator.attrgetter('null', 'blank', 'unique', 'help_text')
+
+# Module names, relative to each app, that hold serializers and views
+_SERIALIZER_MODULES = ('serializers', 'serializer')
+_VIEW_MODULES = ('views',)
+
+# HTTP handlers documented for class-based views
+_HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+
+# Attribute names Django itself defines on every model
+_MODEL_BASE_ATTRS = frozenset(dir(models.Model))
+
+# Serializer base class names, used when rest_framework cannot be imported
+_DRF_BASE_NAMES = frozenset({
+    'BaseSerializer', 'Serializer', 'ListSerializer', 'ModelSerializer', 'HyperlinkedModelSerializer'
+})
+
+
+def _has_as_view(cls: type) -> bool:
+    """Return True if cls or one of its bases defines as_view, without invoking descriptors"""
+    return any('as_view' in vars(base) for base in cls.__mro__)
+
+
+def _may_define_serializers(module: ModuleType, drf_bases: Optional[set]) -> bool:
+    """Cheap pre-check: does the module reference DRF or anything serializer-like at all?"""
+    for value in vars(module).values():
+        origin = value.__name__ if inspect.ismodule(value) else getattr(value, '__module__', None)
+        if isinstance(origin, str) and origin.startswith('rest_framework'):
+            return True
+        if inspect.isclass(value):
+            # Serializer bases imported from a sibling module, or ModelForm-style classes
+            if drf_bases is not None and not drf_bases.isdisjoint(value.__mro__):
+                return True
+            if hasattr(getattr(value, '_meta', None), 'model'):
+                return True
+    return False
+
+
+def _field_options(field: Any) -> Tuple[Any, Any, Any, str]:
+    """Return (null, blank, unique, help_text) for a model field or relation"""
+    field_dict = vars(field)
+    if '_unique' in field_dict:
+        # Concrete fields keep their options in the instance __dict__, so read
+        # them from that one snapshot; unique is a property over _unique and primary_key
+        null, blank, unique, help_text = (
+            field_dict['null'],
+            field_dict['blank'],
+            field_dict['_unique'] or field_dict['primary_key'],
+            field_dict['help_text'],
+        )
+    else:
+        try:
+            null, blank, unique, help_text = _FIELD_ATTRS(field)
+        except AttributeError:
+            # Reverse relations lack some attributes; fall back per attribute
+            null, blank, unique, help_text = (
+                getattr(field, 'null', False),
+                getattr(field, 'blank', False),
+                getattr(field, 'unique', False),
+                getattr(field, 'help_text', ''),
+            )
+
+    # Lazy translation strings only evaluate while Django is configured, which a
+    # cached analysis loaded later is not, so resolve them here
+    if isinstance(help_text, Promise):
+        help_text = str(help_text)
+    return null, blank, unique, help_text
+
+
+def _project_namespaces(model: type) -> Iterator[Tuple[str, Any]]:
+    """Yield the __dict__ items of model and its project-defined bases, nearest first
+
+    Only classes between model and models.Model are visited, and Django's own
+    abstract models (AbstractUser & co.) are skipped, so methods inherited from
+    a project's abstract base models are found without walking Django's hierarchy.
+    """
+    for cls in model.__mro__:
+        if cls is models.Model:
+            break
+        if cls is model or not cls.__module__.startswith('django.'):
+            yield from vars(cls).items()
+
+
+@functools.lru_cache(maxsize=1024)
+def _describe_serializer(cls: type) -> Tuple[Optional[str], Tuple, Tuple, Tuple]:
+    """Return (model_name, fields, exclude, read_only_fields) for a serializer class
+
+    The result only depends on the class, so it is computed once per class
+    even when the analysis is re-run in the same process.
+    """
+    # Get model name if it's a ModelSerializer
+    model_name = None
+    if hasattr(cls, 'Meta') and hasattr(cls.Meta, 'model'):
+        model_name = cls.Meta.model.__name__
+    elif hasattr(cls, '_meta') and hasattr(cls._meta, 'model'):
+        model_name = cls._meta.model.__name__
+
+    # Get fields
+    options = cls.Meta if hasattr(cls, 'Meta') else getattr(cls, '_meta', None)
+    if options is None:
+        return model_name, (), (), ()
+
+    return (
+        model_name,
+        tuple(getattr(options, 'fields', [])),
+        tuple(getattr(options, 'exclude', [])),
+        tuple(getattr(options, 'read_only_fields', [])),
+    )
 
 
 class DjangoAnalyzer:
     """Analyzes Django project structure and extracts documentation data"""
     
-    def __init__(self, project_path: str, settings_module: str):
+    def __init__(self, project_path: str, settings_module: str, max_workers: int = MAX_WORKERS):
         self.project_path = project_path
         self.settings_module = settings_module
+        self.max_workers = max_workers
         self.models_data = {}
         self.serializers_data = {}
         self.views_data = {}
+        self._module_cache: Dict[str, Optional[ModuleType]] = {}
+        self._members_cache: Dict[str, List[Tuple[str, Any]]] = {}
+        self._doc_cache: Dict[int, Tuple[Any, str]] = {}
+        self._drf_bases: Optional[set] = None
+        self._drf_bases_resolved = False
         
     def setup_django(self):
         """Setup Django environment for analysis"""
@@ -35,197 +167,385 @@ class DjangoAnalyzer:
         except Exception as e:
             raise RuntimeError(f"Failed to setup Django: {e}")
     
+    def _safe_import(self, module_name: str) -> Optional[ModuleType]:
+        """Import a module once, returning None if it cannot be imported"""
+        if module_name not in self._module_cache:
+            try:
+                # Probe the finders first; most apps ship no serializers module and a
+                # failed find_spec is far cheaper than a failed import
+                if importlib.util.find_spec(module_name) is None:
+                    self._module_cache[module_name] = None
+                    return None
+                self._module_cache[module_name] = importlib.import_module(module_name)
+            except (ImportError, ValueError) as e:
+                logger.debug("Could not import %s: %s", module_name, e)
+                self._module_cache[module_name] = None
+        return self._module_cache[module_name]
+    
+    def _get_members(self, module: ModuleType) -> List[Tuple[str, Any]]:
+        """Return the (name, object) pairs defined in module itself, scanning each module only once"""
+        module_name = module.__name__
+        members = self._members_cache.get(module_name)
+        if members is None:
+            # Reading the module __dict__ avoids dir()'s sort and a getattr per name;
+            # imported symbols are dropped before any further inspection
+            members = [
+                (name, obj) for name, obj in list(vars(module).items())
+                if getattr(obj, '__module__', None) == module_name
+            ]
+            self._members_cache[module_name] = members
+        return members
+    
+    def _getdoc(self, obj: Any) -> str:
+        """Return the cleaned docstring obj itself defines, or "", computing it once per object"""
+        cached = self._doc_cache.get(id(obj))
+        if cached is None:
+            # Keep a reference to obj so its id cannot be reused by another object
+            doc = getattr(obj, '__doc__', None)
+            cached = (obj, _cleandoc(doc) if isinstance(doc, str) else "")
+            self._doc_cache[id(obj)] = cached
+        return cached[1]
+    
+    def _with_submodules(self, module: ModuleType) -> List[ModuleType]:
+        """Return the module plus, if it is a package, its direct submodules"""
+        modules = [module]
+        # Plain modules have no __path__, so there is nothing more to scan
+        if hasattr(module, '__path__'):
+            for _, submodule_name, is_package in pkgutil.iter_modules(module.__path__):
+                if not is_package:
+                    submodule = self._safe_import(f"{module.__name__}.{submodule_name}")
+                    if submodule is not None:
+                        modules.append(submodule)
+        return modules
+    
+    def _iter_apps(self, analyze_app: Callable[[Any], Dict[str, Any]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Run analyze_app for every installed app on a thread pool, yielding results in app order"""
+        app_configs = list(apps.get_app_configs())
+        if not app_configs:
+            return
+
+        if self.max_workers <= 1:
+            # Analyze apps inline, e.g. to get readable tracebacks while debugging
+            for app_config in app_configs:
+                app_data = analyze_app(app_config)
+                if app_data:
+                    yield app_config.name, app_data
+            return
+
+        # Imports are mostly file I/O, so analyzing apps in parallel overlaps it
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(app_configs))) as executor:
+            for app_config, app_data in zip(app_configs, executor.map(analyze_app, app_configs)):
+                if app_data:
+                    yield app_config.name, app_data
+    
+    def _app_modules(self, app_config, module_names: Tuple[str, ...]) -> List[ModuleType]:
+        """Import app_config.<name> for each candidate name, expanding packages into submodules"""
+        modules = []
+        for module_name in module_names:
+            module = self._safe_import(f"{app_config.name}.{module_name}")
+            if module is not None:
+                modules.extend(self._with_submodules(module))
+        return modules
+    
+    def _resolve_drf_bases(self):
+        """Resolve the DRF serializer base classes every per-app worker compares against"""
+        # rest_framework needs configured settings, so this can't happen at import time
+        if self._drf_bases_resolved:
+            return
+
+        # Resolve the DRF base classes once so detection is a single set test
+        try:
+            from rest_framework import serializers as drf_serializers
+            self._drf_bases = {
+                drf_serializers.BaseSerializer,
+                drf_serializers.Serializer,
+                drf_serializers.ListSerializer,
+                drf_serializers.ModelSerializer,
+                drf_serializers.HyperlinkedModelSerializer,
+            }
+        except ImportError:
+            self._drf_bases = None
+        self._drf_bases_resolved = True
+    
     def analyze_models(self) -> Dict[str, Any]:
         """Extract information from Django models"""
-        models_info = {}
+        models_info = dict(self.iter_models())
+        self.models_data = models_info
+        return models_info
+    
+    def iter_models(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (app_name, models) pairs, one app at a time"""
+        yield from self._iter_apps(self._analyze_app_models)
+    
+    def _analyze_app_models(self, app_config) -> Dict[str, Any]:
+        """Extract model information for a single app"""
+        base_model_attrs = _MODEL_BASE_ATTRS
+        # Bind the per-field/per-member helpers locally for the traversal loops
+        field_options = _field_options
+        getdoc = self._getdoc
+        isclass = inspect.isclass
+        app_models = {}
         
-        for app_config in apps.get_app_configs():
-            app_models = {}
+        for model in app_config.get_models():
+            model_info = {
+                'name': model.__name__,
+                'app': app_config.name,
+                'table_name': model._meta.db_table,
+                'fields': {},
+                'relationships': {},
+                'methods': [],
+                'docstring': getdoc(model)
+            }
+            fields = model_info['fields']
+            relationships = model_info['relationships']
+            methods = model_info['methods']
             
-            for model in app_config.get_models():
-                model_info = {
-                    'name': model.__name__,
-                    'app': app_config.name,
-                    'table_name': model._meta.db_table,
-                    'fields': {},
-                    'relationships': {},
-                    'methods': [],
-                    'docstring': inspect.getdoc(model) or ""
+            # Analyze fields
+            for field in model._meta.get_fields():
+                null, blank, unique, help_text = field_options(field)
+
+                field_info = {
+                    'type': field.__class__.__name__,
+                    'null': null,
+                    'blank': blank,
+                    'unique': unique,
+                    'help_text': help_text,
                 }
                 
-                # Analyze fields
-                for field in model._meta.get_fields():
-                    field_info = {
-                        'type': field.__class__.__name__,
-                        'null': getattr(field, 'null', False),
-                        'blank': getattr(field, 'blank', False),
-                        'unique': getattr(field, 'unique', False),
-                        'help_text': getattr(field, 'help_text', ''),
+                # Handle relationships
+                # related_model is a cached_property, so it lands in the __dict__ once read
+                related_model = vars(field).get('related_model') or getattr(field, 'related_model', None)
+                if related_model:
+                    field_info['related_model'] = related_model.__name__
+                    relationships[field.name] = {
+                        'type': field_info['type'],
+                        'related_model': related_model.__name__,
+                        'related_app': related_model._meta.app_label
                     }
-                    
-                    # Handle relationships
-                    if hasattr(field, 'related_model') and field.related_model:
-                        field_info['related_model'] = field.related_model.__name__
-                        model_info['relationships'][field.name] = {
-                            'type': field.__class__.__name__,
-                            'related_model': field.related_model.__name__,
-                            'related_app': field.related_model._meta.app_label
-                        }
-                    
-                    model_info['fields'][field.name] = field_info
-                
-                # Get custom methods (excluding Django internals)
-                for name, method in inspect.getmembers(model, predicate=inspect.ismethod):
-                    if not name.startswith('_') and not hasattr(models.Model, name):
-                        model_info['methods'].append({
-                            'name': name,
-                            'docstring': inspect.getdoc(method) or ""
-                        })
                 
-                app_models[model.__name__] = model_info
+                fields[field.name] = field_info
             
-            if app_models:
-                models_info[app_config.name] = app_models
+            # Get custom methods (excluding Django internals). On a class, plain
+            # methods are functions, so scan the class namespaces rather than
+            # filtering inspect.getmembers() with ismethod
+            seen = set()
+            for name, method in _project_namespaces(model):
+                if name.startswith('_') or name in base_model_attrs or name in seen:
+                    continue
+                seen.add(name)
+                if isinstance(method, (classmethod, staticmethod)):
+                    method = method.__func__
+                elif not callable(method) or isclass(method):
+                    # Skip field descriptors, managers and DoesNotExist & co.
+                    continue
+                methods.append({
+                    'name': name,
+                    'docstring': getdoc(method)
+                })
+            
+            app_models[model.__name__] = model_info
         
-        self.models_data = models_info
-        return models_info
+        logger.debug("Found %d models in %s", len(app_models), app_config.name)
+        return app_models
     
     def analyze_serializers(self) -> Dict[str, Any]:
         """Extract information from DRF serializers"""
-        serializers_info = {}
+        serializers_info = dict(self.iter_serializers())
+        self.serializers_data = serializers_info
+        return serializers_info
+    
+    def iter_serializers(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (app_name, serializers) pairs, one app at a time"""
+        self._resolve_drf_bases()
+        yield from self._iter_apps(self._analyze_app_serializers)
+    
+    def _analyze_app_serializers(self, app_config) -> Dict[str, Any]:
+        """Extract serializer information for a single app"""
+        drf_bases = self._drf_bases
+        try:
+            # Try to import serializers module(s); any error raised while importing them
+            # is reported for this app below instead of aborting the whole analysis
+            serializer_modules = self._app_modules(app_config, _SERIALIZER_MODULES)
+            if not serializer_modules:
+                # No serializers module in this app
+                return {}
 
-        for app_config in apps.get_app_configs():
-            try:
-                # Try to import serializers module
-                serializers_module = importlib.import_module(f"{app_config.name}.serializers")
-                app_serializers = {}
+            app_serializers = {}
 
-                for name, obj in inspect.getmembers(serializers_module):
+            for module in serializer_modules:
+                # Helper modules that never touch DRF cannot define a serializer
+                if not _may_define_serializers(module, drf_bases):
+                    continue
+                for name, obj in self._get_members(module):
                     # Check if it's a class and looks like a DRF serializer
                     if inspect.isclass(obj):
-                        is_serializer = False
-
                         # Check if it inherits from Serializer
-                        for base in obj.__mro__:
-                            if base.__name__ in ('Serializer', 'ModelSerializer', 'HyperlinkedModelSerializer'):
-                                is_serializer = True
-                                break
+                        if drf_bases is not None:
+                            is_serializer = not drf_bases.isdisjoint(obj.__mro__)
+                        else:
+                            is_serializer = any(base.__name__ in _DRF_BASE_NAMES for base in obj.__mro__)
 
                         # Also check for _meta attribute (ModelForm style)
                         if not is_serializer and hasattr(obj, '_meta') and hasattr(obj._meta, 'model'):
                             is_serializer = True
 
                         if is_serializer:
-                            # Get model name if it's a ModelSerializer
-                            model_name = None
-                            if hasattr(obj, 'Meta') and hasattr(obj.Meta, 'model'):
-                                model_name = obj.Meta.model.__name__
-                            elif hasattr(obj, '_meta') and hasattr(obj._meta, 'model'):
-                                model_name = obj._meta.model.__name__
-
-                            # Get fields
-                            fields = []
-                            exclude = []
-                            read_only_fields = []
-
-                            if hasattr(obj, 'Meta'):
-                                fields = list(getattr(obj.Meta, 'fields', []))
-                                exclude = list(getattr(obj.Meta, 'exclude', []))
-                                read_only_fields = list(getattr(obj.Meta, 'read_only_fields', []))
-                            elif hasattr(obj, '_meta'):
-                                fields = list(getattr(obj._meta, 'fields', []))
-                                exclude = list(getattr(obj._meta, 'exclude', []))
-                                read_only_fields = list(getattr(obj._meta, 'read_only_fields', []))
+                            model_name, fields, exclude, read_only_fields = _describe_serializer(obj)
 
                             serializer_info = {
                                 'name': name,
                                 'app': app_config.name,
                                 'model': model_name,
-                                'fields': fields,
-                                'exclude': exclude,
-                                'read_only_fields': read_only_fields,
-                                'docstring': inspect.getdoc(obj) or ""
+                                'fields': list(fields),
+                                'exclude': list(exclude),
+                                'read_only_fields': list(read_only_fields),
+                                'docstring': self._getdoc(obj)
                             }
 
                             app_serializers[name] = serializer_info
 
-                if app_serializers:
-                    serializers_info[app_config.name] = app_serializers
-
-            except ImportError:
-                # No serializers module in this app
-                continue
-            except Exception as e:
-                print(f"Warning: Could not analyze serializers in {app_config.name}: {e}")
+            logger.debug("Found %d serializers in %s", len(app_serializers), app_config.name)
+            return app_serializers
 
-        self.serializers_data = serializers_info
-        return serializers_info
+        except Exception as e:
+            logger.warning("Could not analyze serializers in %s: %s", app_config.name, e)
+            return {}
     
     def analyze_views(self) -> Dict[str, Any]:
         """Extract information from Django views"""
-        views_info = {}
-        
-        for app_config in apps.get_app_configs():
-            try:
-                # Try to import views module
-                views_module = importlib.import_module(f"{app_config.name}.views")
-                app_views = {}
-                
-                for name, obj in inspect.getmembers(views_module):
-                    if inspect.isclass(obj) and hasattr(obj, 'as_view'):
+        views_info = dict(self.iter_views())
+        self.views_data = views_info
+        return views_info
+    
+    def iter_views(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (app_name, views) pairs, one app at a time"""
+        yield from self._iter_apps(self._analyze_app_views)
+    
+    def _analyze_app_views(self, app_config) -> Dict[str, Any]:
+        """Extract view information for a single app"""
+        getdoc = self._getdoc
+        try:
+            # Try to import views module(s); any error raised while importing them
+            # is reported for this app below instead of aborting the whole analysis
+            view_modules = self._app_modules(app_config, _VIEW_MODULES)
+            if not view_modules:
+                # No views module in this app
+                return {}
+
+            app_views = {}
+
+            for module in view_modules:
+                for name, obj in self._get_members(module):
+                    if inspect.isclass(obj) and _has_as_view(obj):
                         view_info = {
                             'name': name,
                             'app': app_config.name,
                             'type': 'class_based',
                             'base_classes': [cls.__name__ for cls in obj.__bases__],
                             'methods': [],
-                            'docstring': inspect.getdoc(obj) or ""
+                            'docstring': getdoc(obj)
                         }
-                        
+                    
                         # Get HTTP methods
-                        http_methods = ['get', 'post', 'put', 'patch', 'delete', 'head', 'options']
-                        for method in http_methods:
-                            if hasattr(obj, method):
-                                method_obj = getattr(obj, method)
+                        for method in _HTTP_METHODS:
+                            method_obj = getattr(obj, method, None)
+                            if method_obj is not None:
                                 view_info['methods'].append({
                                     'name': method.upper(),
-                                    'docstring': inspect.getdoc(method_obj) or ""
+                                    'docstring': getdoc(method_obj)
                                 })
-                        
-                        app_views[name] = view_info
                     
+                        app_views[name] = view_info
+                
                     elif inspect.isfunction(obj) and not name.startswith('_'):
                         view_info = {
                             'name': name,
                             'app': app_config.name,
                             'type': 'function_based',
-                            'docstring': inspect.getdoc(obj) or ""
+                            'docstring': getdoc(obj)
                         }
                         app_views[name] = view_info
-                
-                if app_views:
-                    views_info[app_config.name] = app_views
-                    
-            except ImportError:
-                # No views module in this app
-                continue
-            except Exception as e:
-                print(f"Warning: Could not analyze views in {app_config.name}: {e}")
-        
-        self.views_data = views_info
-        return views_info
+            
+            logger.debug("Found %d views in %s", len(app_views), app_config.name)
+            return app_views
+
+        except Exception as e:
+            logger.warning("Could not analyze views in %s: %s", app_config.name, e)
+            return {}
+    
+    def _analyze_app(self, app_config) -> Dict[str, Dict[str, Any]]:
+        """Run every pass for a single app, so its modules are imported and inspected together"""
+        return {
+            'models': self._analyze_app_models(app_config),
+            'serializers': self._analyze_app_serializers(app_config),
+            'views': self._analyze_app_views(app_config),
+        }
     
     def analyze_project(self) -> Dict[str, Any]:
         """Perform complete project analysis"""
         self.setup_django()
+        self._resolve_drf_bases()
+        
+        # Each worker analyzes one whole app; transpose the results into the
+        # per-section dicts the generators expect, counting entries as we go
+        models_info, serializers_info, views_info = {}, {}, {}
+        counts = {'models': 0, 'serializers': 0, 'views': 0}
+        for app_name, app_data in self._iter_apps(self._analyze_app):
+            for section, section_info in (
+                ('models', models_info),
+                ('serializers', serializers_info),
+                ('views', views_info),
+            ):
+                if app_data[section]:
+                    section_info[app_name] = app_data[section]
+                    counts[section] += len(app_data[section])
+        
+        self.models_data = models_info
+        self.serializers_data = serializers_info
+        self.views_data = views_info
         
         return {
-            'models': self.analyze_models(),
-            'serializers': self.analyze_serializers(),
-            'views': self.analyze_views(),
+            'models': models_info,
+            'serializers': serializers_info,
+            'views': views_info,
+            'counts': counts,
             'project_info': {
                 'path': self.project_path,
                 'settings': self.settings_module,
                 'apps': [app.name for app in apps.get_app_configs()]
             }
         }
+    
+    def analyze_project_stream(self, out: TextIO):
+        """Perform complete project analysis, writing it to out as JSON one app at a time
+
+        Produces the same document as json.dumps(analyze_project()) without
+        holding the whole analysis in memory.
+        """
+        self.setup_django()
+
+        counts = {}
+        out.write('{')
+        for index, (section, app_items) in enumerate((
+            ('models', self.iter_models()),
+            ('serializers', self.iter_serializers()),
+            ('views', self.iter_views()),
+        )):
+            if index:
+                out.write(', ')
+            out.write(f'{json.dumps(section)}: {{')
+            counts[section] = 0
+            for app_index, (app_name, app_data) in enumerate(app_items):
+                if app_index:
+                    out.write(', ')
+                out.write(f'{json.dumps(app_name)}: {json.dumps(app_data)}')
+                counts[section] += len(app_data)
+            out.write('}')
+        out.write(f', "counts": {json.dumps(counts)}')
+
+        project_info = {
+            'path': self.project_path,
+            'settings': self.settings_module,
+            'apps': [app.name for app in apps.get_app_configs()]
+        }
+        out.write(f', "project_info": {json.dumps(project_info)}}}')
@@ -0,0 +1,89 @@
+"""
+On-disk cache of analysis results, keyed on the project's Python sources
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import __version__
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = ".aiwiki_cache"
+
+
+def _iter_sources(target_path: str):
+    """Yield every .py file under target_path, skipping hidden and __pycache__ directories"""
+    for root, dirs, files in os.walk(target_path):
+        # Prune in place so os.walk never descends into .git, .venv, the cache, etc.
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != '__pycache__')
+        for name in sorted(files):
+            if name.endswith('.py'):
+                yield os.path.join(root, name)
+
+
+def _installed_distributions() -> List[str]:
+    """Return the sorted dist-info/egg-info directory names found on sys.path
+
+    Those names carry each installed distribution's name and version, so this
+    covers Django, DRF and any other app analyzed along with the project's,
+    without importing them or parsing their metadata.
+    """
+    names = []
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or os.curdir) as entries:
+                names.extend(e.name for e in entries if e.name.endswith(('.dist-info', '.egg-info')))
+        except OSError:
+            # Missing directories and zip archives on sys.path
+            continue
+    return sorted(names)
+
+
+def cache_key(target_path: str, settings_module: str) -> str:
+    """Hash every source file's path and mtime, plus the settings module, Python and package versions"""
+    digest = hashlib.blake2b(f"{__version__}:{settings_module}:{sys.version}\n".encode('utf-8'),
+                             digest_size=16)
+    for name in _installed_distributions():
+        digest.update(f"{name}\n".encode('utf-8'))
+    for path in _iter_sources(target_path):
+        digest.update(f"{path}:{os.stat(path).st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_analysis(target_path: str, key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached analysis for key, or None if there is no usable entry"""
+    cache_file = Path(target_path) / CACHE_DIR_NAME / f"{key}.json"
+    try:
+        # JSON rather than pickle: the cache lives in the checkout, and loading
+        # a pickle from a shared tree could run arbitrary code
+        return json.loads(cache_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A truncated or incompatible entry is just a cache miss
+        logger.debug("Ignoring unreadable cache entry %s: %s", cache_file, e)
+        return None
+
+
+def store_analysis(target_path: str, key: str, analysis_data: Dict[str, Any]):
+    """Write analysis_data as the only cache entry, replacing stale ones"""
+    cache_dir = Path(target_path) / CACHE_DIR_NAME
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        for stale in cache_dir.iterdir():
+            # Includes the .pkl entries written by earlier versions
+            if stale.suffix in ('.json', '.pkl'):
+                stale.unlink()
+
+        # Write to a temporary name first so a crash never leaves a partial entry
+        tmp_file = cache_dir / f"{key}.tmp"
+        tmp_file.write_text(json.dumps(analysis_data), encoding='utf-8')
+        os.replace(tmp_file, cache_dir / f"{key}.json")
+    except Exception as e:
+        logger.debug("Could not write analysis cache in %s: %s", cache_dir, e)
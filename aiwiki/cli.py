@@ -3,32 +3,66 @@
 AI Wiki CLI - Command line interface for Django documentation generation
 """
 
-import argparse
+import logging
 import os
 import sys
-import requests
-import json
 from pathlib import Path
+from types import SimpleNamespace
 
-from .analyzer import DjangoAnalyzer
-from .generators import MarkdownGenerator, MermaidGenerator, HTMLGenerator
-from .server import start_server
+# The analyzer (Django), generators, server (Flask) and requests are imported
+# inside the commands that use them, so `aiwiki --help` and `aiwiki serve`
+# don't pay for loading the whole stack
+
+
+_SESSION = None
+
+
+def _session():
+    """Return the shared requests.Session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+    return _SESSION
 
 
 def send_to_database(project_data: dict):
     """Send project documentation to the dashboard database"""
+    import json
+    import requests
+
     try:
         # Default API endpoint - can be configured via environment variable
         api_url = os.getenv('AIWIKI_API_URL', 'http://localhost:3000/api/projects')
 
         print(f"📤 Sending documentation to dashboard database...")
 
-        response = requests.post(
-            api_url,
-            json=project_data,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
+        # Encode once, compactly and without \u-escaping, and hand requests the finished bytes
+        payload = json.dumps(project_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+
+        # The dashboard must opt in to compressed request bodies via AIWIKI_API_GZIP=1
+        if os.getenv('AIWIKI_API_GZIP') == '1':
+            import gzip
+            response = _session().post(
+                api_url,
+                data=gzip.compress(payload, compresslevel=1),
+                headers={**headers, 'Content-Encoding': 'gzip'},
+                timeout=30
+            )
+            # Servers that can't decode the body reject it; resend it uncompressed
+            if response.status_code in (400, 415):
+                response = None
+        else:
+            response = None
+
+        if response is None:
+            response = _session().post(
+                api_url,
+                data=payload,
+                headers=headers,
+                timeout=30
+            )
 
         if response.status_code == 200:
             result = response.json()
@@ -49,18 +83,39 @@ def send_to_database(project_data: dict):
         return False
 
 
-def generate_docs(target_path: str, settings_module: str):
+def generate_docs(target_path: str, settings_module: str, debug: bool = False, use_cache: bool = True):
     """Generate documentation for Django project"""
+    from concurrent.futures import ThreadPoolExecutor
+    from .analyzer import DjangoAnalyzer
+    from .cache import cache_key, load_analysis, store_analysis
+    from .generators import MarkdownGenerator, MermaidGenerator, HTMLGenerator
+
     print(f"🔍 Analyzing Django project at: {target_path}")
     print(f"📋 Using settings: {settings_module}")
     
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.WARNING,
+        format="%(levelname)s: %(message)s"
+    )
+    
     try:
-        # Initialize analyzer
-        analyzer = DjangoAnalyzer(target_path, settings_module)
+        # Reuse the previous analysis if no source file has changed since
+        analysis_data = None
+        if use_cache:
+            key = cache_key(target_path, settings_module)
+            analysis_data = load_analysis(target_path, key)
         
-        # Perform analysis
-        print("⚙️  Loading Django and analyzing project...")
-        analysis_data = analyzer.analyze_project()
+        if analysis_data is not None:
+            print("⚡ Sources unchanged, using cached analysis...")
+        else:
+            # Initialize analyzer
+            analyzer = DjangoAnalyzer(target_path, settings_module)
+            
+            # Perform analysis
+            print("⚙️  Loading Django and analyzing project...")
+            analysis_data = analyzer.analyze_project()
+            if use_cache:
+                store_analysis(target_path, key, analysis_data)
         
         # Create docs directory
         docs_dir = Path(target_path) / "docs"
@@ -71,49 +126,51 @@ def generate_docs(target_path: str, settings_module: str):
         markdown_gen = MarkdownGenerator(analysis_data)
         markdown_content = markdown_gen.generate_full_documentation()
         
-        project_md_path = docs_dir / "project.md"
-        with open(project_md_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        print(f"✅ Created: {project_md_path}")
-        
         # Generate Mermaid diagram
         print("🎨 Generating Mermaid ERD diagram...")
         mermaid_gen = MermaidGenerator(analysis_data)
         diagram_content = mermaid_gen.generate_erd()
-        
-        diagram_md_path = docs_dir / "diagram.md"
-        with open(diagram_md_path, 'w', encoding='utf-8') as f:
-            f.write(f"# Entity Relationship Diagram\n\n{diagram_content}\n")
-        
-        print(f"✅ Created: {diagram_md_path}")
 
         # Generate HTML documentation
         print("🎨 Generating HTML documentation...")
         html_gen = HTMLGenerator(analysis_data)
         html_content = html_gen.generate_html_documentation()
 
-        project_html_path = docs_dir / "project.html"
-        with open(project_html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Write the three files concurrently; each is encoded up front and
+        # written with a single write_bytes call
+        outputs = [
+            (docs_dir / "project.md", markdown_content),
+            (docs_dir / "diagram.md", f"# Entity Relationship Diagram\n\n{diagram_content}\n"),
+            (docs_dir / "project.html", html_content),
+        ]
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            list(executor.map(lambda output: output[0].write_bytes(output[1].encode('utf-8')), outputs))
 
-        print(f"✅ Created: {project_html_path}")
+        for output_path, _ in outputs:
+            print(f"✅ Created: {output_path}")
 
         # Summary
-        models_count = sum(len(app_models) for app_models in analysis_data.get('models', {}).values())
-        serializers_count = sum(len(app_serializers) for app_serializers in analysis_data.get('serializers', {}).values())
-        views_count = sum(len(app_views) for app_views in analysis_data.get('views', {}).values())
+        counts = analysis_data['counts']
+        models_count = counts['models']
+        serializers_count = counts['serializers']
+        views_count = counts['views']
         
-        print(f"\n📊 Analysis Summary:")
-        print(f"   • {models_count} models")
-        print(f"   • {serializers_count} serializers")
-        print(f"   • {views_count} views")
-        print(f"\n🎉 Documentation generated successfully!")
-        print(f"📁 Output directory: {docs_dir}")
-        print(f"📄 Files created:")
-        print(f"   - project.md (markdown documentation)")
-        print(f"   - diagram.md (Mermaid ERD diagram)")
-        print(f"   - project.html (styled HTML documentation)")
+        # Emit the summary block with a single write
+        summary = [
+            "",
+            "📊 Analysis Summary:",
+            f"   • {models_count} models",
+            f"   • {serializers_count} serializers",
+            f"   • {views_count} views",
+            "",
+            "🎉 Documentation generated successfully!",
+            f"📁 Output directory: {docs_dir}",
+            "📄 Files created:",
+            "   - project.md (markdown documentation)",
+            "   - diagram.md (Mermaid ERD diagram)",
+            "   - project.html (styled HTML documentation)",
+        ]
+        sys.stdout.write("\n".join(summary) + "\n")
 
         # Store documentation in database
         project_name = os.path.basename(os.path.abspath(target_path))
@@ -131,28 +188,31 @@ def generate_docs(target_path: str, settings_module: str):
 
         database_success = send_to_database(project_data)
 
-        print(f"\n💡 Next steps:")
+        next_steps = ["", "💡 Next steps:"]
         if database_success:
-            print(f"   1. Visit the dashboard at http://localhost:3000 to view your project")
-            print(f"   2. Run 'aiwiki serve' to browse documentation locally")
-            print(f"   3. Or open the files directly in your editor")
+            next_steps.append("   1. Visit the dashboard at http://localhost:3000 to view your project")
+            next_steps.append("   2. Run 'aiwiki serve' to browse documentation locally")
+            next_steps.append("   3. Or open the files directly in your editor")
         else:
-            print(f"   1. Run 'aiwiki serve' to browse documentation")
-            print(f"   2. Or open the files directly in your editor")
-            print(f"   3. Open project.html in your browser for visual documentation")
+            next_steps.append("   1. Run 'aiwiki serve' to browse documentation")
+            next_steps.append("   2. Or open the files directly in your editor")
+            next_steps.append("   3. Open project.html in your browser for visual documentation")
+        sys.stdout.write("\n".join(next_steps) + "\n")
         
     except Exception as e:
         print(f"❌ Error generating documentation: {e}")
         sys.exit(1)
 
 
-def serve_docs(port: int = 8000):
+def serve_docs(port: int = 8000, debug: bool = False):
     """Start the Flask web server"""
+    from .server import start_server
+
     print(f"🚀 Starting AI Wiki server on http://localhost:{port}")
     print("📖 Opening browser...")
     
     try:
-        start_server(port)
+        start_server(port, debug)
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
     except Exception as e:
@@ -160,8 +220,10 @@ def serve_docs(port: int = 8000):
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point"""
+def build_parser():
+    """Build the full argparse parser, used for --help, errors and unusual invocations"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="AI Wiki - Auto-generate browsable Django REST API documentation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -190,6 +252,16 @@ Examples:
         required=True,
         help='Django settings module (e.g., myproject.settings)'
     )
+    generate_parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Show debug output while analyzing the project'
+    )
+    generate_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-analyze the project even if its sources are unchanged'
+    )
     
     # Serve command
     serve_parser = subparsers.add_parser(
@@ -202,13 +274,80 @@ Examples:
         default=8000,
         help='Port to run server on (default: 8000)'
     )
+    serve_parser.add_argument(
+        '--debug',
+        action='store_true',
+        help="Run Flask's development server in debug mode"
+    )
     
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+
+# Options each command accepts: name -> whether it takes a value
+_COMMAND_OPTIONS = {
+    'generate': {'--target': True, '--settings': True, '--debug': False, '--no-cache': False},
+    'serve': {'--port': True, '--debug': False},
+}
+
+
+def _parse_fast(argv):
+    """Parse the common well-formed invocations without loading argparse
+
+    Returns None for anything outside the plain grammar (--help, unknown or
+    repeated options, missing values, bad port numbers), so argparse can
+    handle it with its usual messages.
+    """
+    if not argv or argv[0] not in _COMMAND_OPTIONS:
+        return None
+    command, rest = argv[0], argv[1:]
+    options = _COMMAND_OPTIONS[command]
+
+    values = {}
+    index = 0
+    while index < len(rest):
+        name, sep, value = rest[index].partition('=')
+        if name not in options or name in values:
+            return None
+        if options[name]:
+            if not sep:
+                index += 1
+                if index == len(rest) or rest[index].startswith('-'):
+                    return None
+                value = rest[index]
+            values[name] = value
+        elif sep:
+            return None
+        else:
+            values[name] = True
+        index += 1
+
+    if command == 'generate':
+        if '--target' not in values or '--settings' not in values:
+            return None
+        return SimpleNamespace(
+            command=command,
+            target=values['--target'],
+            settings=values['--settings'],
+            debug=values.get('--debug', False),
+            no_cache=values.get('--no-cache', False),
+        )
+
+    port = values.get('--port', '8000')
+    if not port.isdecimal():
+        return None
+    return SimpleNamespace(command=command, port=int(port), debug=values.get('--debug', False))
+
+
+def main():
+    """Main CLI entry point"""
+    args = _parse_fast(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
     
-    if not args.command:
-        parser.print_help()
-        return
+        if not args.command:
+            parser.print_help()
+            return
     
     if args.command == 'generate':
         # Validate target path
@@ -227,10 +366,10 @@ Examples:
                 print("   Aborted.")
                 sys.exit(1)
         
-        generate_docs(target_path, args.settings)
+        generate_docs(target_path, args.settings, args.debug, not args.no_cache)
     
     elif args.command == 'serve':
-        serve_docs(args.port)
+        serve_docs(args.port, args.debug)
 
 
 if __name__ == '__main__':
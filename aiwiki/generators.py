@@ -2,9 +2,77 @@
 Documentation generators for markdown, HTML, and Mermaid diagrams
 """
 
+import io
 import os
-from typing import Dict, Any
-from datetime import datetime
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from typing import Dict, Any, List, Tuple
+
+
+def _gil_enabled() -> bool:
+    """Return whether the GIL is active; always True before Python 3.13"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def _intern_strings(data: Dict[str, Any]) -> None:
+    """Intern the docstring, help_text and type strings of analysis data in place
+
+    The same help texts, field types and inherited docstrings recur across
+    many fields and classes; interning makes those repeats share one object.
+    Values are replaced by equal strings, so the data's content is unchanged.
+    """
+    intern = sys.intern
+
+    def intern_key(entry: Dict[str, Any], key: str):
+        value = entry.get(key)
+        # Only plain str values can be interned
+        if type(value) is str:
+            entry[key] = intern(value)
+
+    for app_models in data.get('models', {}).values():
+        for model_info in app_models.values():
+            intern_key(model_info, 'docstring')
+            for field_info in model_info.get('fields', {}).values():
+                intern_key(field_info, 'type')
+                intern_key(field_info, 'help_text')
+            for method in model_info.get('methods', []):
+                intern_key(method, 'docstring')
+
+    for section in ('serializers', 'views'):
+        for app_entries in data.get(section, {}).values():
+            for entry in app_entries.values():
+                intern_key(entry, 'docstring')
+                for method in entry.get('methods', []):
+                    intern_key(method, 'docstring')
+
+
+def _field_rows(fields: Dict[str, Dict[str, Any]]) -> List[Tuple[str, str, Any, Any, Any, str]]:
+    """Project a model's fields into (name, type, null, blank, unique, help_text) rows
+
+    Every generator walks the fields in this fixed column order, so the dict
+    lookups and defaults live in one place and the render loops just unpack.
+    """
+    return [
+        (
+            field_name,
+            field_info.get('type', 'Unknown'),
+            field_info.get('null'),
+            field_info.get('blank'),
+            field_info.get('unique'),
+            field_info.get('help_text', ''),
+        )
+        for field_name, field_info in fields.items()
+    ]
+
+
+# Markdown table cell for a boolean field option, indexed by the option's truth value
+_CHECK = ("✗", "✓")
+
+# One row of the markdown model fields table
+_ROW_FMT = "| {n} | {t} | {nu} | {bl} | {un} | {ht} |\n"
 
 
 class MarkdownGenerator:
@@ -12,13 +80,23 @@ class MarkdownGenerator:
     
     def __init__(self, analysis_data: Dict[str, Any]):
         self.data = analysis_data
+        _intern_strings(analysis_data)
     
     def generate_project_overview(self) -> str:
         """Generate project overview section"""
+        buf = io.StringIO()
+        self._write_project_overview(buf)
+        return buf.getvalue()
+    
+    def _write_project_overview(self, buf: io.StringIO):
+        """Write the project overview section to buf"""
+        w = buf.write
         project_info = self.data.get('project_info', {})
         apps = project_info.get('apps', [])
+        # Built outside the f-string, where a backslash is not allowed before Python 3.12
+        app_list = "\n".join([f"- {app}" for app in apps])
         
-        overview = f"""# Django Project Documentation
+        w(f"""# Django Project Documentation
 
 ## Project Overview
 
@@ -27,154 +105,206 @@ class MarkdownGenerator:
 **Total Apps:** {len(apps)}
 
 ### Installed Apps
-{chr(10).join(f"- {app}" for app in apps)}
+{app_list}
 
 ---
 
-"""
-        return overview
+""")
     
     def generate_models_section(self) -> str:
         """Generate models documentation section"""
+        buf = io.StringIO()
+        self._write_models_section(buf)
+        return buf.getvalue()
+    
+    def _write_models_section(self, buf: io.StringIO):
+        """Write the models documentation section to buf"""
+        w = buf.write
         models = self.data.get('models', {})
         if not models:
-            return "## Models\n\nNo models found.\n\n---\n\n"
+            w("## Models\n\nNo models found.\n\n---\n\n")
+            return
         
-        section = "## Models\n\n"
+        w("## Models\n\n")
         
         for app_name, app_models in models.items():
-            section += f"### {app_name.title()} App Models\n\n"
+            w(f"### {app_name.title()} App Models\n\n")
             
             for model_name, model_info in app_models.items():
-                section += f"#### {model_name}\n\n"
+                w(f"#### {model_name}\n\n")
                 
                 if model_info.get('docstring'):
-                    section += f"{model_info['docstring']}\n\n"
+                    w(f"{model_info['docstring']}\n\n")
                 
-                section += f"**Table:** `{model_info.get('table_name', 'N/A')}`\n\n"
+                w(f"**Table:** `{model_info.get('table_name', 'N/A')}`\n\n")
                 
                 # Fields
                 fields = model_info.get('fields', {})
                 if fields:
-                    section += "**Fields:**\n\n"
-                    section += "| Field | Type | Null | Blank | Unique | Help Text |\n"
-                    section += "|-------|------|------|-------|--------|----------|\n"
+                    w(
+                        "**Fields:**\n\n"
+                        "| Field | Type | Null | Blank | Unique | Help Text |\n"
+                        "|-------|------|------|-------|--------|----------|\n"
+                    )
                     
-                    for field_name, field_info in fields.items():
-                        null_str = "✓" if field_info.get('null') else "✗"
-                        blank_str = "✓" if field_info.get('blank') else "✗"
-                        unique_str = "✓" if field_info.get('unique') else "✗"
-                        help_text = field_info.get('help_text', '').replace('|', '\\|')
-                        
-                        section += f"| {field_name} | {field_info.get('type', 'Unknown')} | {null_str} | {blank_str} | {unique_str} | {help_text} |\n"
+                    for field_name, field_type, is_null, is_blank, is_unique, help_text in _field_rows(fields):
+                        w(_ROW_FMT.format(
+                            n=field_name,
+                            t=field_type,
+                            nu=_CHECK[bool(is_null)],
+                            bl=_CHECK[bool(is_blank)],
+                            un=_CHECK[bool(is_unique)],
+                            ht=help_text.replace('|', '\\|'),
+                        ))
                     
-                    section += "\n"
+                    w("\n")
                 
                 # Relationships
                 relationships = model_info.get('relationships', {})
                 if relationships:
-                    section += "**Relationships:**\n\n"
+                    w("**Relationships:**\n\n")
                     for rel_name, rel_info in relationships.items():
-                        section += f"- **{rel_name}**: {rel_info.get('type')} → `{rel_info.get('related_app')}.{rel_info.get('related_model')}`\n"
-                    section += "\n"
+                        w(f"- **{rel_name}**: {rel_info.get('type')} → `{rel_info.get('related_app')}.{rel_info.get('related_model')}`\n")
+                    w("\n")
                 
                 # Custom methods
                 methods = model_info.get('methods', [])
                 if methods:
-                    section += "**Custom Methods:**\n\n"
+                    w("**Custom Methods:**\n\n")
                     for method in methods:
-                        section += f"- **{method['name']}()**: {method.get('docstring', 'No description')}\n"
-                    section += "\n"
+                        w(f"- **{method['name']}()**: {method.get('docstring', 'No description')}\n")
+                    w("\n")
                 
-                section += "---\n\n"
-        
-        return section
+                w("---\n\n")
     
     def generate_serializers_section(self) -> str:
         """Generate serializers documentation section"""
+        buf = io.StringIO()
+        self._write_serializers_section(buf)
+        return buf.getvalue()
+    
+    def _write_serializers_section(self, buf: io.StringIO):
+        """Write the serializers documentation section to buf"""
+        w = buf.write
         serializers = self.data.get('serializers', {})
         if not serializers:
-            return "## Serializers\n\nNo serializers found.\n\n---\n\n"
+            w("## Serializers\n\nNo serializers found.\n\n---\n\n")
+            return
         
-        section = "## Serializers\n\n"
+        w("## Serializers\n\n")
         
         for app_name, app_serializers in serializers.items():
-            section += f"### {app_name.title()} App Serializers\n\n"
+            w(f"### {app_name.title()} App Serializers\n\n")
             
             for serializer_name, serializer_info in app_serializers.items():
-                section += f"#### {serializer_name}\n\n"
+                w(f"#### {serializer_name}\n\n")
                 
                 if serializer_info.get('docstring'):
-                    section += f"{serializer_info['docstring']}\n\n"
+                    w(f"{serializer_info['docstring']}\n\n")
                 
                 model = serializer_info.get('model')
                 if model:
-                    section += f"**Model:** `{model}`\n\n"
+                    w(f"**Model:** `{model}`\n\n")
                 
                 fields = serializer_info.get('fields', [])
                 if fields:
-                    section += f"**Fields:** {', '.join(f'`{field}`' for field in fields)}\n\n"
+                    w(f"**Fields:** {', '.join(f'`{field}`' for field in fields)}\n\n")
                 
                 exclude = serializer_info.get('exclude', [])
                 if exclude:
-                    section += f"**Excluded Fields:** {', '.join(f'`{field}`' for field in exclude)}\n\n"
+                    w(f"**Excluded Fields:** {', '.join(f'`{field}`' for field in exclude)}\n\n")
                 
                 read_only = serializer_info.get('read_only_fields', [])
                 if read_only:
-                    section += f"**Read-Only Fields:** {', '.join(f'`{field}`' for field in read_only)}\n\n"
+                    w(f"**Read-Only Fields:** {', '.join(f'`{field}`' for field in read_only)}\n\n")
                 
-                section += "---\n\n"
-        
-        return section
+                w("---\n\n")
     
     def generate_views_section(self) -> str:
         """Generate views documentation section"""
+        buf = io.StringIO()
+        self._write_views_section(buf)
+        return buf.getvalue()
+    
+    def _write_views_section(self, buf: io.StringIO):
+        """Write the views documentation section to buf"""
+        w = buf.write
         views = self.data.get('views', {})
         if not views:
-            return "## Views\n\nNo views found.\n\n---\n\n"
+            w("## Views\n\nNo views found.\n\n---\n\n")
+            return
         
-        section = "## Views\n\n"
+        w("## Views\n\n")
         
         for app_name, app_views in views.items():
-            section += f"### {app_name.title()} App Views\n\n"
+            w(f"### {app_name.title()} App Views\n\n")
             
             for view_name, view_info in app_views.items():
-                section += f"#### {view_name}\n\n"
+                w(f"#### {view_name}\n\n")
                 
                 if view_info.get('docstring'):
-                    section += f"{view_info['docstring']}\n\n"
+                    w(f"{view_info['docstring']}\n\n")
                 
                 view_type = view_info.get('type', 'unknown')
-                section += f"**Type:** {view_type.replace('_', ' ').title()}\n\n"
+                w(f"**Type:** {view_type.replace('_', ' ').title()}\n\n")
                 
                 if view_type == 'class_based':
                     base_classes = view_info.get('base_classes', [])
                     if base_classes:
-                        section += f"**Base Classes:** {', '.join(f'`{cls}`' for cls in base_classes)}\n\n"
+                        w(f"**Base Classes:** {', '.join(f'`{cls}`' for cls in base_classes)}\n\n")
                     
                     methods = view_info.get('methods', [])
                     if methods:
-                        section += "**HTTP Methods:**\n\n"
+                        w("**HTTP Methods:**\n\n")
                         for method in methods:
                             method_doc = method.get('docstring', 'No description')
-                            section += f"- **{method['name']}**: {method_doc}\n"
-                        section += "\n"
+                            w(f"- **{method['name']}**: {method_doc}\n")
+                        w("\n")
                 
-                section += "---\n\n"
-        
-        return section
+                w("---\n\n")
     
     def generate_full_documentation(self) -> str:
         """Generate complete markdown documentation"""
-        doc = self.generate_project_overview()
-        doc += self.generate_models_section()
-        doc += self.generate_serializers_section()
-        doc += self.generate_views_section()
+        buf = io.StringIO()
+        self._write_project_overview(buf)
+        self._write_models_section(buf)
+        self._write_serializers_section(buf)
+        self._write_views_section(buf)
         
         # Add generation timestamp
-        doc += f"\n---\n\n*Documentation generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        buf.write(f"\n---\n\n*Documentation generated on {time.strftime('%Y-%m-%d %H:%M:%S')}*\n")
         
-        return doc
+        return buf.getvalue()
+
+
+# Django field types mapped to the simpler type names shown in the ERD
+_MERMAID_TYPE_MAP = {
+    'CharField': 'string',
+    'TextField': 'text',
+    'IntegerField': 'int',
+    'BigIntegerField': 'bigint',
+    'FloatField': 'float',
+    'DecimalField': 'decimal',
+    'BooleanField': 'boolean',
+    'DateField': 'date',
+    'DateTimeField': 'datetime',
+    'EmailField': 'email',
+    'URLField': 'url',
+    'UUIDField': 'uuid',
+    'ForeignKey': 'fk',
+    'OneToOneField': 'o2o',
+    'ManyToManyField': 'm2m'
+}
+
+# ERD attribute comments, indexed by unique << 1 | not null
+_MERMAID_CONSTRAINTS = ('', ' "NOT NULL"', ' "UK"', ' "UK NOT NULL"')
+
+# ERD relationship line formatters by Django field type; other relation types are not drawn
+_MERMAID_REL_TEMPLATES = {
+    'ForeignKey': "    {m} ||--o{{ {r} : {n}\n".format,
+    'OneToOneField': "    {m} ||--|| {r} : {n}\n".format,
+    'ManyToManyField': "    {m} }}o--o{{ {r} : {n}\n".format,
+}
 
 
 class MermaidGenerator:
@@ -189,91 +319,48 @@ class MermaidGenerator:
         if not models:
             return "```mermaid\nerDiagram\n    NO_MODELS {\n        string message \"No models found\"\n    }\n```"
         
-        diagram = "```mermaid\nerDiagram\n"
+        parts = ["```mermaid\nerDiagram\n"]
         
         # Generate entities
         for app_name, app_models in models.items():
             for model_name, model_info in app_models.items():
-                diagram += f"    {model_name} {{\n"
+                parts.append(f"    {model_name} {{\n")
                 
                 # Add fields
                 fields = model_info.get('fields', {})
-                for field_name, field_info in fields.items():
-                    field_type = field_info.get('type', 'Unknown')
+                for field_name, field_type, is_null, _, is_unique, _ in _field_rows(fields):
                     
                     # Convert Django field types to simpler types for diagram
-                    type_mapping = {
-                        'CharField': 'string',
-                        'TextField': 'text',
-                        'IntegerField': 'int',
-                        'BigIntegerField': 'bigint',
-                        'FloatField': 'float',
-                        'DecimalField': 'decimal',
-                        'BooleanField': 'boolean',
-                        'DateField': 'date',
-                        'DateTimeField': 'datetime',
-                        'EmailField': 'email',
-                        'URLField': 'url',
-                        'UUIDField': 'uuid',
-                        'ForeignKey': 'fk',
-                        'OneToOneField': 'o2o',
-                        'ManyToManyField': 'm2m'
-                    }
-                    
-                    simple_type = type_mapping.get(field_type, field_type.lower())
+                    simple_type = _MERMAID_TYPE_MAP.get(field_type) or field_type.lower()
                     
                     # Add constraints
-                    constraints = []
-                    if field_info.get('unique'):
-                        constraints.append('UK')
-                    if not field_info.get('null'):
-                        constraints.append('NOT NULL')
-                    
-                    constraint_str = f" \"{' '.join(constraints)}\"" if constraints else ""
-                    diagram += f"        {simple_type} {field_name}{constraint_str}\n"
+                    constraint_str = _MERMAID_CONSTRAINTS[bool(is_unique) << 1 | (not is_null)]
+                    parts.append(f"        {simple_type} {field_name}{constraint_str}\n")
                 
-                diagram += "    }\n"
+                parts.append("    }\n")
         
         # Generate relationships
         for app_name, app_models in models.items():
             for model_name, model_info in app_models.items():
                 relationships = model_info.get('relationships', {})
                 for rel_name, rel_info in relationships.items():
-                    rel_type = rel_info.get('type')
-                    related_model = rel_info.get('related_model')
-                    
-                    if rel_type == 'ForeignKey':
-                        diagram += f"    {model_name} ||--o{{ {related_model} : {rel_name}\n"
-                    elif rel_type == 'OneToOneField':
-                        diagram += f"    {model_name} ||--|| {related_model} : {rel_name}\n"
-                    elif rel_type == 'ManyToManyField':
-                        diagram += f"    {model_name} }}o--o{{ {related_model} : {rel_name}\n"
+                    fmt = _MERMAID_REL_TEMPLATES.get(rel_info.get('type'))
+                    if fmt:
+                        parts.append(fmt(m=model_name, r=rel_info.get('related_model'), n=rel_name))
         
-        diagram += "```"
-        return diagram
+        parts.append("```")
+        return "".join(parts)
 
 
-class HTMLGenerator:
-    """Generates comprehensive HTML documentation from Django analysis data"""
-
-    def __init__(self, analysis_data: Dict[str, Any]):
-        self.data = analysis_data
-
-    def generate_html_documentation(self) -> str:
-        """Generate complete HTML documentation with styling and images"""
-        project_info = self.data.get('project_info', {})
-        models = self.data.get('models', {})
-        serializers = self.data.get('serializers', {})
-        views = self.data.get('views', {})
-
-        html = f"""<!DOCTYPE html>
+# Static head, stylesheet and page header of the HTML documentation
+_HTML_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Django Project Documentation</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -282,80 +369,80 @@ class HTMLGenerator:
             padding: 20px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             padding: 40px;
             margin: 20px 0;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 40px;
             padding: 30px;
             background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
             border-radius: 15px;
             color: white;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
             font-weight: 700;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 10px 0 0 0;
             font-size: 1.2em;
             opacity: 0.9;
-        }}
-        .section {{
+        }
+        .section {
             margin: 40px 0;
             padding: 30px;
             background: #f8f9fa;
             border-radius: 10px;
             border-left: 5px solid #007bff;
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             color: #007bff;
             margin-top: 0;
             font-size: 2em;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
-        .section h3 {{
+        }
+        .section h3 {
             color: #495057;
             border-bottom: 2px solid #e9ecef;
             padding-bottom: 10px;
             margin-top: 30px;
-        }}
-        .section h4 {{
+        }
+        .section h4 {
             color: #6c757d;
             margin-top: 25px;
             padding: 15px;
             background: white;
             border-radius: 8px;
             border-left: 4px solid #28a745;
-        }}
-        .info-grid {{
+        }
+        .info-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
-        .info-card {{
+        }
+        .info-card {
             background: white;
             padding: 20px;
             border-radius: 10px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             border-left: 4px solid #17a2b8;
-        }}
-        .info-card strong {{
+        }
+        .info-card strong {
             color: #17a2b8;
             display: block;
             margin-bottom: 5px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
@@ -363,39 +450,39 @@ class HTMLGenerator:
             border-radius: 8px;
             overflow: hidden;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px 15px;
             text-align: left;
             border-bottom: 1px solid #e9ecef;
-        }}
-        th {{
+        }
+        th {
             background: #007bff;
             color: white;
             font-weight: 600;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background: #f8f9fa;
-        }}
-        .badge {{
+        }
+        .badge {
             display: inline-block;
             padding: 4px 8px;
             border-radius: 4px;
             font-size: 0.8em;
             font-weight: 600;
             margin: 2px;
-        }}
-        .badge-success {{ background: #d4edda; color: #155724; }}
-        .badge-danger {{ background: #f8d7da; color: #721c24; }}
-        .badge-info {{ background: #d1ecf1; color: #0c5460; }}
-        .badge-warning {{ background: #fff3cd; color: #856404; }}
-        .apps-list {{
+        }
+        .badge-success { background: #d4edda; color: #155724; }
+        .badge-danger { background: #f8d7da; color: #721c24; }
+        .badge-info { background: #d1ecf1; color: #0c5460; }
+        .badge-warning { background: #fff3cd; color: #856404; }
+        .apps-list {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
             gap: 15px;
             margin: 20px 0;
-        }}
-        .app-item {{
+        }
+        .app-item {
             background: white;
             padding: 15px;
             border-radius: 8px;
@@ -403,18 +490,18 @@ class HTMLGenerator:
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             border: 2px solid #e9ecef;
             transition: all 0.3s ease;
-        }}
-        .app-item:hover {{
+        }
+        .app-item:hover {
             border-color: #007bff;
             transform: translateY(-2px);
-        }}
-        .relationships {{
+        }
+        .relationships {
             background: #e8f4fd;
             padding: 15px;
             border-radius: 8px;
             margin: 15px 0;
-        }}
-        .relationship-item {{
+        }
+        .relationship-item {
             display: flex;
             align-items: center;
             gap: 10px;
@@ -422,21 +509,21 @@ class HTMLGenerator:
             padding: 8px;
             background: white;
             border-radius: 6px;
-        }}
-        .methods {{
+        }
+        .methods {
             background: #f0f8f0;
             padding: 15px;
             border-radius: 8px;
             margin: 15px 0;
-        }}
-        .method-item {{
+        }
+        .method-item {
             background: white;
             padding: 10px;
             margin: 8px 0;
             border-radius: 6px;
             border-left: 3px solid #28a745;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             text-align: center;
             margin-top: 40px;
             padding: 20px;
@@ -444,17 +531,17 @@ class HTMLGenerator:
             border-radius: 10px;
             color: #6c757d;
             font-style: italic;
-        }}
-        .icon {{
+        }
+        .icon {
             font-size: 1.2em;
-        }}
-        code {{
+        }
+        code {
             background: #f8f9fa;
             padding: 2px 6px;
             border-radius: 4px;
             font-family: 'Monaco', 'Consolas', monospace;
             color: #e83e8c;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -464,44 +551,105 @@ class HTMLGenerator:
             <p>Comprehensive API Documentation with Visual Elements</p>
         </div>"""
 
+# Static footer around the generation timestamp
+_HTML_TIMESTAMP_OPEN = """
+        <div class="timestamp">
+            📅 Documentation generated on """
+_HTML_SUFFIX = """
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+def _constraint_badges(index: int) -> str:
+    """Render the constraint badges for a field whose null/blank/unique flags are the bits of index"""
+    null, blank, unique = index & 1, index & 2, index & 4
+    badges = []
+    if not null:
+        badges.append('<span class="badge badge-danger">NOT NULL</span>')
+    if not blank:
+        badges.append('<span class="badge badge-warning">NOT BLANK</span>')
+    if unique:
+        badges.append('<span class="badge badge-info">UNIQUE</span>')
+    return ' '.join(badges) if badges else '<span class="badge badge-success">None</span>'
+
+
+# Constraint badges for every flag combination, indexed by null | blank << 1 | unique << 2
+_HTML_CONSTRAINT_BADGES = tuple(_constraint_badges(index) for index in range(8))
+
+
+def _html_escape(text: str) -> str:
+    """Escape &, < and > in text rendered into an HTML element; quotes are left as-is"""
+    return escape(text, quote=False)
+
+
+# One row of the HTML model fields table
+_HTML_FIELD_ROW = """
+                        <tr>
+                            <td><strong>{name}</strong></td>
+                            <td><code>{type}</code></td>
+                            <td>{constraints}</td>
+                            <td>{help_text}</td>
+                        </tr>"""
+
+# Icons for relationship types; anything else gets the plain link icon
+_HTML_REL_ICONS = {
+    'OneToOneField': '🔐',
+    'ManyToManyField': '🔀',
+}
+
+
+class HTMLGenerator:
+    """Generates comprehensive HTML documentation from Django analysis data"""
+
+    def __init__(self, analysis_data: Dict[str, Any]):
+        self.data = analysis_data
+        _intern_strings(analysis_data)
+
+    def generate_html_documentation(self) -> str:
+        """Generate complete HTML documentation with styling and images"""
+        project_info = self.data.get('project_info', {})
+        models = self.data.get('models', {})
+        serializers = self.data.get('serializers', {})
+        views = self.data.get('views', {})
+
+        buf = io.StringIO()
+        buf.write(_HTML_PREFIX)
+
         # Project Overview Section
-        html += self._generate_project_overview_html(project_info)
+        self._write_project_overview_html(buf, project_info)
 
         # Models Section
-        html += self._generate_models_section_html(models)
+        self._write_models_section_html(buf, models)
 
         # Serializers Section
-        html += self._generate_serializers_section_html(serializers)
+        self._write_serializers_section_html(buf, serializers)
 
         # Views Section
-        html += self._generate_views_section_html(views)
+        self._write_views_section_html(buf, views)
 
         # Footer with timestamp
-        html += f"""
-        <div class="timestamp">
-            📅 Documentation generated on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}
-        </div>
-    </div>
-</body>
-</html>"""
+        buf.write(_HTML_TIMESTAMP_OPEN + time.strftime('%Y-%m-%d at %H:%M:%S') + _HTML_SUFFIX)
 
-        return html
+        return buf.getvalue()
 
-    def _generate_project_overview_html(self, project_info: Dict[str, Any]) -> str:
-        """Generate HTML for project overview section"""
+    def _write_project_overview_html(self, buf: io.StringIO, project_info: Dict[str, Any]):
+        """Write the HTML for project overview section to buf"""
+        w = buf.write
         apps = project_info.get('apps', [])
 
-        html = f"""
+        w(f"""
         <div class="section">
             <h2><span class="icon">📋</span> Project Overview</h2>
             <div class="info-grid">
                 <div class="info-card">
                     <strong>📁 Project Path</strong>
-                    <code>{project_info.get('path', 'N/A')}</code>
+                    <code>{_html_escape(str(project_info.get('path', 'N/A')))}</code>
                 </div>
                 <div class="info-card">
                     <strong>⚙️ Settings Module</strong>
-                    <code>{project_info.get('settings', 'N/A')}</code>
+                    <code>{_html_escape(str(project_info.get('settings', 'N/A')))}</code>
                 </div>
                 <div class="info-card">
                     <strong>📦 Total Apps</strong>
@@ -510,57 +658,75 @@ class HTMLGenerator:
             </div>
 
             <h3>📱 Installed Applications</h3>
-            <div class="apps-list">"""
+            <div class="apps-list">""")
 
-        for app in apps:
-            html += f"""
+        buf.writelines(f"""
                 <div class="app-item">
                     <strong>{app}</strong>
-                </div>"""
+                </div>""" for app in apps)
 
-        html += """
+        w("""
             </div>
-        </div>"""
-
-        return html
+        </div>""")
 
-    def _generate_models_section_html(self, models: Dict[str, Any]) -> str:
-        """Generate HTML for models section"""
+    def _write_models_section_html(self, buf: io.StringIO, models: Dict[str, Any]):
+        """Write the HTML for models section to buf"""
+        w = buf.write
         if not models:
-            return """
+            w("""
         <div class="section">
             <h2><span class="icon">🗃️</span> Models</h2>
             <p style="text-align: center; color: #6c757d; font-style: italic;">No models found in this project.</p>
-        </div>"""
+        </div>""")
+            return
 
-        html = """
+        w("""
         <div class="section">
-            <h2><span class="icon">🗃️</span> Models</h2>"""
-
-        for app_name, app_models in models.items():
-            html += f"""
-            <h3>📦 {app_name.title()} App Models</h3>"""
-
-            for model_name, model_info in app_models.items():
-                html += f"""
-                <h4>🏷️ {model_name}</h4>"""
-
-                if model_info.get('docstring'):
-                    html += f"""
+            <h2><span class="icon">🗃️</span> Models</h2>""")
+
+        if len(models) > 1 and not _gil_enabled():
+            # Only free-threaded builds can actually render apps side by side
+            with ThreadPoolExecutor(max_workers=min(len(models), os.cpu_count() or 1)) as executor:
+                buf.writelines(executor.map(self._render_app_models_html, models.keys(), models.values()))
+        else:
+            for app_name, app_models in models.items():
+                self._write_app_models_html(buf, app_name, app_models)
+
+        w("""
+        </div>""")
+
+    def _render_app_models_html(self, app_name: str, app_models: Dict[str, Any]) -> str:
+        """Render the HTML for one app's models into a string"""
+        buf = io.StringIO()
+        self._write_app_models_html(buf, app_name, app_models)
+        return buf.getvalue()
+
+    def _write_app_models_html(self, buf: io.StringIO, app_name: str, app_models: Dict[str, Any]):
+        """Write the HTML for one app's models to buf"""
+        w = buf.write
+        w(f"""
+            <h3>📦 {app_name.title()} App Models</h3>""")
+
+        for model_name, model_info in app_models.items():
+            w(f"""
+                <h4>🏷️ {model_name}</h4>""")
+
+            if model_info.get('docstring'):
+                w(f"""
                 <p style="background: #e8f4fd; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #007bff;">
-                    <strong>Description:</strong> {model_info['docstring']}
-                </p>"""
+                    <strong>Description:</strong> {_html_escape(model_info['docstring'])}
+                </p>""")
 
-                html += f"""
+            w(f"""
                 <div class="info-card" style="margin: 15px 0;">
                     <strong>🗂️ Database Table</strong>
                     <code>{model_info.get('table_name', 'N/A')}</code>
-                </div>"""
+                </div>""")
 
-                # Fields table
-                fields = model_info.get('fields', {})
-                if fields:
-                    html += """
+            # Fields table
+            fields = model_info.get('fields', {})
+            if fields:
+                w("""
                 <h5 style="color: #495057; margin-top: 20px;">📊 Fields</h5>
                 <table>
                     <thead>
@@ -571,121 +737,103 @@ class HTMLGenerator:
                             <th>Help Text</th>
                         </tr>
                     </thead>
-                    <tbody>"""
-
-                    for field_name, field_info in fields.items():
-                        constraints = []
-                        if not field_info.get('null'):
-                            constraints.append('<span class="badge badge-danger">NOT NULL</span>')
-                        if not field_info.get('blank'):
-                            constraints.append('<span class="badge badge-warning">NOT BLANK</span>')
-                        if field_info.get('unique'):
-                            constraints.append('<span class="badge badge-info">UNIQUE</span>')
-
-                        constraints_html = ' '.join(constraints) if constraints else '<span class="badge badge-success">None</span>'
-                        help_text = field_info.get('help_text', '').replace('<', '&lt;').replace('>', '&gt;')
-
-                        html += f"""
-                        <tr>
-                            <td><strong>{field_name}</strong></td>
-                            <td><code>{field_info.get('type', 'Unknown')}</code></td>
-                            <td>{constraints_html}</td>
-                            <td>{help_text or '<em>No help text</em>'}</td>
-                        </tr>"""
-
-                    html += """
+                    <tbody>""")
+
+                for field_name, field_type, is_null, is_blank, is_unique, help_text in _field_rows(fields):
+                    constraints_html = _HTML_CONSTRAINT_BADGES[
+                        bool(is_null) | bool(is_blank) << 1 | bool(is_unique) << 2
+                    ]
+                    help_text = _html_escape(str(help_text or ''))
+
+                    w(_HTML_FIELD_ROW.format_map({
+                        'name': field_name,
+                        'type': field_type,
+                        'constraints': constraints_html,
+                        'help_text': help_text or '<em>No help text</em>',
+                    }))
+
+                w("""
                     </tbody>
-                </table>"""
+                </table>""")
 
-                # Relationships
-                relationships = model_info.get('relationships', {})
-                if relationships:
-                    html += """
+            # Relationships
+            relationships = model_info.get('relationships', {})
+            if relationships:
+                w("""
                 <h5 style="color: #495057; margin-top: 20px;">🔗 Relationships</h5>
-                <div class="relationships">"""
+                <div class="relationships">""")
 
-                    for rel_name, rel_info in relationships.items():
-                        rel_type = rel_info.get('type', 'Unknown')
-                        related_model = rel_info.get('related_model', 'Unknown')
-                        related_app = rel_info.get('related_app', 'Unknown')
-
-                        icon = '🔗'
-                        if rel_type == 'ForeignKey':
-                            icon = '🔗'
-                        elif rel_type == 'OneToOneField':
-                            icon = '🔐'
-                        elif rel_type == 'ManyToManyField':
-                            icon = '🔀'
-
-                        html += f"""
+                for rel_name, rel_info in relationships.items():
+                    rel_type = rel_info.get('type', 'Unknown')
+                    related_model = rel_info.get('related_model', 'Unknown')
+                    related_app = rel_info.get('related_app', 'Unknown')
+
+                    icon = _HTML_REL_ICONS.get(rel_type, '🔗')
+
+                    w(f"""
                     <div class="relationship-item">
                         <span style="font-size: 1.2em;">{icon}</span>
                         <strong>{rel_name}</strong>
                         <span class="badge badge-info">{rel_type}</span>
                         <span>→</span>
                         <code>{related_app}.{related_model}</code>
-                    </div>"""
+                    </div>""")
 
-                    html += """
-                </div>"""
+                w("""
+                </div>""")
 
-                # Custom methods
-                methods = model_info.get('methods', [])
-                if methods:
-                    html += """
+            # Custom methods
+            methods = model_info.get('methods', [])
+            if methods:
+                w("""
                 <h5 style="color: #495057; margin-top: 20px;">⚙️ Custom Methods</h5>
-                <div class="methods">"""
+                <div class="methods">""")
 
-                    for method in methods:
-                        method_doc = method.get('docstring', 'No description available')
-                        html += f"""
+                buf.writelines(f"""
                     <div class="method-item">
                         <strong>🔧 {method['name']}()</strong>
-                        <p style="margin: 5px 0 0 0; color: #6c757d;">{method_doc}</p>
-                    </div>"""
-
-                    html += """
-                </div>"""
+                        <p style="margin: 5px 0 0 0; color: #6c757d;">{_html_escape(method.get('docstring', 'No description available'))}</p>
+                    </div>""" for method in methods)
 
-        html += """
-        </div>"""
-
-        return html
+                w("""
+                </div>""")
 
-    def _generate_serializers_section_html(self, serializers: Dict[str, Any]) -> str:
-        """Generate HTML for serializers section"""
+    def _write_serializers_section_html(self, buf: io.StringIO, serializers: Dict[str, Any]):
+        """Write the HTML for serializers section to buf"""
+        w = buf.write
         if not serializers:
-            return """
+            w("""
         <div class="section">
             <h2><span class="icon">🔄</span> Serializers</h2>
             <p style="text-align: center; color: #6c757d; font-style: italic;">No serializers found in this project.</p>
-        </div>"""
+        </div>""")
+            return
 
-        html = """
+        w("""
         <div class="section">
-            <h2><span class="icon">🔄</span> Serializers</h2>"""
+            <h2><span class="icon">🔄</span> Serializers</h2>""")
 
         for app_name, app_serializers in serializers.items():
-            html += f"""
-            <h3>📦 {app_name.title()} App Serializers</h3>"""
+            w(f"""
+            <h3>📦 {app_name.title()} App Serializers</h3>""")
 
             for serializer_name, serializer_info in app_serializers.items():
-                html += f"""
-                <h4>🔄 {serializer_name}</h4>"""
+                w(f"""
+                <h4>🔄 {serializer_name}</h4>""")
 
                 if serializer_info.get('docstring'):
-                    html += f"""
+                    w(f"""
                 <p style="background: #f0f8f0; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #28a745;">
-                    <strong>Description:</strong> {serializer_info['docstring']}
-                </p>"""
+                    <strong>Description:</strong> {_html_escape(serializer_info['docstring'])}
+                </p>""")
 
                 model = serializer_info.get('model')
                 if model:
-                    html += f"""
+                    w(f"""
                 <div class="info-card" style="margin: 15px 0;">
                     <strong>🗃️ Related Model</strong>
                     <code>{model}</code>
-                </div>"""
+                </div>""")
 
                 # Fields information
                 fields = serializer_info.get('fields', [])
@@ -693,105 +841,101 @@ class HTMLGenerator:
                 read_only = serializer_info.get('read_only_fields', [])
 
                 if fields or exclude or read_only:
-                    html += """
-                <div class="info-grid">"""
+                    w("""
+                <div class="info-grid">""")
 
                     if fields:
                         fields_html = ', '.join(f'<code>{field}</code>' for field in fields)
-                        html += f"""
+                        w(f"""
                     <div class="info-card">
                         <strong>📝 Included Fields</strong>
                         <div style="margin-top: 10px;">{fields_html}</div>
-                    </div>"""
+                    </div>""")
 
                     if exclude:
                         exclude_html = ', '.join(f'<code>{field}</code>' for field in exclude)
-                        html += f"""
+                        w(f"""
                     <div class="info-card">
                         <strong>🚫 Excluded Fields</strong>
                         <div style="margin-top: 10px;">{exclude_html}</div>
-                    </div>"""
+                    </div>""")
 
                     if read_only:
                         readonly_html = ', '.join(f'<code>{field}</code>' for field in read_only)
-                        html += f"""
+                        w(f"""
                     <div class="info-card">
                         <strong>🔒 Read-Only Fields</strong>
                         <div style="margin-top: 10px;">{readonly_html}</div>
-                    </div>"""
+                    </div>""")
 
-                    html += """
-                </div>"""
+                    w("""
+                </div>""")
 
-        html += """
-        </div>"""
-
-        return html
+        w("""
+        </div>""")
 
-    def _generate_views_section_html(self, views: Dict[str, Any]) -> str:
-        """Generate HTML for views section"""
+    def _write_views_section_html(self, buf: io.StringIO, views: Dict[str, Any]):
+        """Write the HTML for views section to buf"""
+        w = buf.write
         if not views:
-            return """
+            w("""
         <div class="section">
             <h2><span class="icon">👁️</span> Views</h2>
             <p style="text-align: center; color: #6c757d; font-style: italic;">No views found in this project.</p>
-        </div>"""
+        </div>""")
+            return
 
-        html = """
+        w("""
         <div class="section">
-            <h2><span class="icon">👁️</span> Views</h2>"""
+            <h2><span class="icon">👁️</span> Views</h2>""")
 
         for app_name, app_views in views.items():
-            html += f"""
-            <h3>📦 {app_name.title()} App Views</h3>"""
+            w(f"""
+            <h3>📦 {app_name.title()} App Views</h3>""")
 
             for view_name, view_info in app_views.items():
-                html += f"""
-                <h4>👁️ {view_name}</h4>"""
+                w(f"""
+                <h4>👁️ {view_name}</h4>""")
 
                 if view_info.get('docstring'):
-                    html += f"""
+                    w(f"""
                 <p style="background: #fff3cd; padding: 15px; border-radius: 8px; margin: 15px 0; border-left: 4px solid #ffc107;">
-                    <strong>Description:</strong> {view_info['docstring']}
-                </p>"""
+                    <strong>Description:</strong> {_html_escape(view_info['docstring'])}
+                </p>""")
 
                 view_type = view_info.get('type', 'unknown')
                 type_display = view_type.replace('_', ' ').title()
 
-                html += f"""
+                w(f"""
                 <div class="info-card" style="margin: 15px 0;">
                     <strong>🏷️ View Type</strong>
                     <span class="badge badge-info">{type_display}</span>
-                </div>"""
+                </div>""")
 
                 if view_type == 'class_based':
                     base_classes = view_info.get('base_classes', [])
                     if base_classes:
                         base_classes_html = ', '.join(f'<code>{cls}</code>' for cls in base_classes)
-                        html += f"""
+                        w(f"""
                 <div class="info-card" style="margin: 15px 0;">
                     <strong>🏗️ Base Classes</strong>
                     <div style="margin-top: 10px;">{base_classes_html}</div>
-                </div>"""
+                </div>""")
 
                     methods = view_info.get('methods', [])
                     if methods:
-                        html += """
+                        w("""
                 <h5 style="color: #495057; margin-top: 20px;">🌐 HTTP Methods</h5>
-                <div class="methods">"""
+                <div class="methods">""")
 
-                        for method in methods:
-                            method_doc = method.get('docstring', 'No description available')
-                            html += f"""
+                        buf.writelines(f"""
                     <div class="method-item">
                         <strong>🌐 {method['name'].upper()}</strong>
-                        <p style="margin: 5px 0 0 0; color: #6c757d;">{method_doc}</p>
-                    </div>"""
-
-                        html += """
-                </div>"""
+                        <p style="margin: 5px 0 0 0; color: #6c757d;">{_html_escape(method.get('docstring', 'No description available'))}</p>
+                    </div>""" for method in methods)
 
-        html += """
-        </div>"""
+                        w("""
+                </div>""")
 
-        return html
+        w("""
+        </div>""")
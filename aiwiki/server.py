@@ -2,123 +2,290 @@
 Flask web server for AI Wiki documentation browser
 """
 
+import gzip
+import hashlib
+import json
 import os
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
 from pathlib import Path
-from flask import Flask, render_template_string, send_file, request, jsonify
-import markdown2
+from types import SimpleNamespace
+from flask import Flask, Response, send_file, request, jsonify
 import requests
+from requests.adapters import HTTPAdapter
 
 
 app = Flask(__name__)
 
-# Global variables for docs content
-docs_content = ""
-diagram_content = ""
-html_content = ""
-docs_available = False
+# (connect, read) timeouts for the hosted chat API: an unreachable API fails
+# fast instead of holding a request thread, while answers still get time to generate
+ASK_TIMEOUT = (5, 30)
 
+# One pooled session for outbound API calls, so /ask reuses kept-alive
+# connections instead of opening a new socket per question
+API_SESSION = requests.Session()
+API_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
+API_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
 
-def load_docs():
-    """Load documentation files if they exist"""
-    global docs_content, diagram_content, html_content, docs_available
+# Everything served from the docs files, built by _read_docs_state() and replaced
+# as a whole, so a request never sees a mix of two loads. The stamp of None makes
+# the first request load the docs if start_server() hasn't
+docs_state = SimpleNamespace(stamp=None)
+_reload_lock = threading.Lock()
+
+DOCS_FILES = ("project.md", "diagram.md", "project.html")
 
+
+def _docs_stamp() -> tuple:
+    """Return the mtime of each docs file, or None for files that don't exist"""
     docs_dir = Path.cwd() / "docs"
-    project_md = docs_dir / "project.md"
-    diagram_md = docs_dir / "diagram.md"
-    project_html = docs_dir / "project.html"
+    stamp = []
+    for name in DOCS_FILES:
+        try:
+            stamp.append(os.stat(docs_dir / name).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
 
-    if project_md.exists() and diagram_md.exists():
-        with open(project_md, 'r', encoding='utf-8') as f:
-            docs_content = f.read()
+def _read_doc(path: Path):
+    """Return a docs file's text, or None if it doesn't exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if hasattr(os, 'posix_fadvise'):
+                # Ask the kernel to pull the whole file into the page cache up front
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _read_docs_state() -> SimpleNamespace:
+    """Read the docs files and pre-render everything the routes serve from them"""
+    # Taken before reading, so a write that lands mid-load triggers another reload
+    stamp = _docs_stamp()
 
-        with open(diagram_md, 'r', encoding='utf-8') as f:
-            diagram_content = f.read()
+    docs_dir = Path.cwd() / "docs"
 
-        # Load HTML content if available
-        if project_html.exists():
-            with open(project_html, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+    # The markdown files are independent, so read them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        project_text, diagram_text = executor.map(
+            _read_doc, [docs_dir / "project.md", docs_dir / "diagram.md"])
+
+    state = SimpleNamespace(
+        stamp=stamp,
+        docs_available=False,
+        docs_content="",
+        diagram_content="",
+        # Size in bytes of project.html, which is served straight from disk (0 if missing)
+        html_size=0,
+        # Models parsed (and escaped) out of docs_content for /view/diagram
+        models_info=[],
+        # Pre-rendered /view/docs and /view/diagram pages: name -> (body, gzipped body, etag)
+        rendered_views={},
+        # Docs context sent with every /ask question, and its JSON encoding
+        combined_docs="",
+        combined_docs_json=b"null",
+    )
+
+    if project_text is not None and diagram_text is not None:
+        state.docs_available = True
+        state.docs_content = project_text
+        state.diagram_content = diagram_text
+
+        # The HTML is only sent as a file, so just check that it exists
+        try:
+            state.html_size = os.stat(docs_dir / "project.html").st_size
+        except OSError:
+            state.html_size = 0
+        if state.html_size:
             print(f"📚 Loaded documentation from {docs_dir} (including HTML)")
         else:
-            html_content = ""
             print(f"📚 Loaded documentation from {docs_dir} (HTML not available)")
 
-        docs_available = True
+        state.models_info = _parse_models(project_text)
+        state.rendered_views = {
+            'docs': _compress_view(_render_docs_view(project_text)),
+            'diagram': _compress_view(_render_diagram_view(state.models_info)),
+        }
+
+        # Combine docs and diagram content once, rather than on every /ask
+        state.combined_docs = f"{project_text}\n\n{diagram_text}"
+        state.combined_docs_json = json.dumps(state.combined_docs).encode('utf-8')
     else:
-        docs_available = False
-        html_content = ""
         print(f"⚠️  No documentation found in {docs_dir}")
         print("   Run 'aiwiki generate' first to create documentation")
 
+    # Pre-serialized /debug payload and rendered dashboard page, with their ETags
+    state.debug_json = _render_debug(state)
+    state.etags = {'debug': _etag(state.debug_json)}
+    state.dashboard_html = _render_dashboard(state)
+    return state
+
+
+def load_docs():
+    """Load documentation files if they exist"""
+    global docs_state
+    with _reload_lock:
+        docs_state = _read_docs_state()
+
+
+@app.before_request
+def _reload_changed_docs():
+    """Reload the in-memory docs if 'aiwiki generate' rewrote them since the last load"""
+    global docs_state
+    if _docs_stamp() == docs_state.stamp:
+        return
+    with _reload_lock:
+        # Another request may have reloaded while this one waited
+        if _docs_stamp() != docs_state.stamp:
+            docs_state = _read_docs_state()
+
+
+_NON_MODEL_HEADINGS = ('#### Serializer', '#### View')
+_REL_TOKENS = ('ForeignKey', 'OneToOne', 'ManyToMany')
+
+
+def _leading_cells(line: str, limit: int = 3) -> list:
+    """Return up to limit non-empty, stripped cells of a markdown table row"""
+    cells = []
+    start = 0
+    while len(cells) < limit:
+        end = line.find('|', start)
+        cell = (line[start:] if end == -1 else line[start:end]).strip()
+        if cell:
+            cells.append(cell)
+        if end == -1:
+            break
+        start = end + 1
+    return cells
+
+
+def _parse_models(content: str) -> list:
+    """Extract each model's fields and relationships from the markdown docs
+
+    Names and types come back HTML-escaped, ready to drop into the page templates.
+    """
+    models_info = []
+    lines = content.split('\n')
+    current_model = None
+
+    for line in lines:
+        if line.startswith('#### ') and not line.startswith(_NON_MODEL_HEADINGS):
+            # This is a model name
+            model_name = escape(line.replace('#### ', '').strip())
+            current_model = {'name': model_name, 'fields': [], 'relationships': []}
+            models_info.append(current_model)
+        elif current_model and '|' in line and 'Field' not in line and '---' not in line:
+            # This is a field row in a table
+            parts = _leading_cells(line)
+            if len(parts) == 3:
+                field_name, field_type = parts[0], parts[1]
+                field = {'name': escape(field_name), 'type': escape(field_type)}
+                if any(token in field_type for token in _REL_TOKENS):
+                    current_model['relationships'].append(field)
+                else:
+                    current_model['fields'].append(field)
+
+    return models_info
+
+
+def _render_dashboard(state: SimpleNamespace) -> bytes:
+    """Render the dashboard page for a docs state"""
+    return COMPILED_TEMPLATE.render(docs_available=state.docs_available,
+                                    docs_content=state.docs_content,
+                                    diagram_content=state.diagram_content,
+                                    html_available=bool(state.html_size)).encode('utf-8')
+
 
 @app.route('/')
 def dashboard():
     """Main dashboard route"""
-    # Debug: Print content info
-    print(f"DEBUG: docs_available = {docs_available}")
-    print(f"DEBUG: docs_content length = {len(docs_content) if docs_content else 0}")
-    print(f"DEBUG: diagram_content length = {len(diagram_content) if diagram_content else 0}")
-    print(f"DEBUG: html_content length = {len(html_content) if html_content else 0}")
+    # The page only depends on the loaded docs, so it is rendered once per load
+    return Response(docs_state.dashboard_html, mimetype='text/html')
 
-    return render_template_string(HTML_TEMPLATE,
-                                docs_available=docs_available,
-                                docs_content=docs_content,
-                                diagram_content=diagram_content,
-                                html_available=bool(html_content))
 
+def _etag(data: bytes) -> str:
+    """Content hash used as a strong ETag"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
-@app.route('/view/docs')
-def view_docs():
-    """View documentation in new tab"""
-    if not docs_available:
-        return "No documentation available", 404
 
-    html = f"""<!DOCTYPE html>
+def _conditional(response: Response, etag: str) -> Response:
+    """Tag a response and turn it into a 304 if the client already has it"""
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def _compress_view(html: str) -> tuple:
+    """Encode a rendered page, along with its gzipped form and ETag"""
+    body = html.encode('utf-8')
+    return body, gzip.compress(body, compresslevel=6), _etag(body)
+
+
+def _view_response(state: SimpleNamespace, name: str) -> Response:
+    """Serve a pre-rendered page, gzipped when the client accepts it"""
+    body, body_gz, etag = state.rendered_views[name]
+    if request.accept_encodings['gzip']:
+        response = Response(body_gz, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        # Each encoding is a different representation, so it needs its own tag
+        etag += '-gzip'
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    return _conditional(response, etag)
+
+
+def _render_docs_view(docs_content: str) -> str:
+    """Render the plain-text documentation page"""
+    return f"""<!DOCTYPE html>
 <html><head><title>Django Documentation</title>
 <style>body{{font-family:Arial,sans-serif;margin:40px;line-height:1.6;}}
 pre{{background:#f5f5f5;padding:15px;border-radius:5px;overflow-x:auto;}}</style>
 </head><body><pre>{docs_content}</pre></body></html>"""
-    return html
+
+
+@app.route('/view/docs')
+def view_docs():
+    """View documentation in new tab"""
+    state = docs_state
+    if not state.docs_available:
+        return "No documentation available", 404
+
+    return _view_response(state, 'docs')
+
 
 @app.route('/view/html')
 def view_html():
     """View HTML documentation in new tab"""
-    if not docs_available or not html_content:
+    state = docs_state
+    if not state.docs_available or not state.html_size:
         return "No HTML documentation available", 404
 
-    return html_content
+    # Served from disk, so the WSGI server can use its file wrapper (sendfile where
+    # available) and send_file handles ETags and Range requests
+    try:
+        return send_file(Path.cwd() / "docs" / "project.html", mimetype='text/html',
+                         conditional=True, etag=True)
+    except FileNotFoundError:
+        return "No HTML documentation available", 404
 
-@app.route('/view/diagram')
-def view_diagram():
-    """View models as interactive table"""
-    if not docs_available:
-        return "No documentation available", 404
 
-    # Parse the docs content to extract model information
-    models_info = []
-    lines = docs_content.split('\n')
-    current_model = None
+# Fragments of the models overview page, filled from the parsed model dicts
+MODEL_TMPL = """
+<div class="model" data-name="{name}">
+<div class="model-header">{name}</div>
+<div class="model-content">
+"""
+FIELD_TMPL = '<div class="field"><strong>{name}</strong><br>{type}</div>'
+REL_TMPL = '<div class="rel">• {name} ({type})</div>'
 
-    for line in lines:
-        if line.startswith('#### ') and not line.startswith('#### Serializer') and not line.startswith('#### View'):
-            # This is a model name
-            model_name = line.replace('#### ', '').strip()
-            current_model = {'name': model_name, 'fields': [], 'relationships': []}
-            models_info.append(current_model)
-        elif current_model and '|' in line and 'Field' not in line and '---' not in line:
-            # This is a field row in a table
-            parts = [p.strip() for p in line.split('|') if p.strip()]
-            if len(parts) >= 3:
-                field_name = parts[0]
-                field_type = parts[1]
-                if 'ForeignKey' in field_type or 'OneToOne' in field_type or 'ManyToMany' in field_type:
-                    current_model['relationships'].append({'name': field_name, 'type': field_type})
-                else:
-                    current_model['fields'].append({'name': field_name, 'type': field_type})
 
-    # Generate HTML
-    html = f"""<!DOCTYPE html>
+def _render_diagram_view(models_info: list) -> str:
+    """Render the models overview page from the parsed models"""
+    parts = [f"""<!DOCTYPE html>
 <html><head><title>Django Models Overview</title>
 <style>
 body{{font-family:Arial,sans-serif;margin:20px;}}
@@ -146,30 +313,34 @@ models[i].style.display=name.includes(filter)?'':'none';
 <h1>🎨 Django Models Overview</h1>
 <input type="text" id="search" class="search" placeholder="Search models..." onkeyup="searchModels()">
 <p><strong>Total Models:</strong> {len(models_info)}</p>
-"""
+"""]
 
     for model in models_info:
-        html += f"""
-<div class="model" data-name="{model['name']}">
-<div class="model-header">{model['name']}</div>
-<div class="model-content">
-"""
+        parts.append(MODEL_TMPL.format_map(model))
         if model['fields']:
-            html += '<div class="fields">'
-            for field in model['fields']:
-                html += f'<div class="field"><strong>{field["name"]}</strong><br>{field["type"]}</div>'
-            html += '</div>'
+            parts.append('<div class="fields">')
+            parts.extend(map(FIELD_TMPL.format_map, model['fields']))
+            parts.append('</div>')
 
         if model['relationships']:
-            html += '<div class="relationships"><strong>🔗 Relationships:</strong><br>'
-            for rel in model['relationships']:
-                html += f'<div class="rel">• {rel["name"]} ({rel["type"]})</div>'
-            html += '</div>'
+            parts.append('<div class="relationships"><strong>🔗 Relationships:</strong><br>')
+            parts.extend(map(REL_TMPL.format_map, model['relationships']))
+            parts.append('</div>')
+
+        parts.append('</div></div>')
+
+    parts.append('</body></html>')
+    return ''.join(parts)
 
-        html += '</div></div>'
 
-    html += '</body></html>'
-    return html
+@app.route('/view/diagram')
+def view_diagram():
+    """View models as interactive table"""
+    state = docs_state
+    if not state.docs_available:
+        return "No documentation available", 404
+
+    return _view_response(state, 'diagram')
 
 @app.route('/download/<filename>')
 def download_file(filename):
@@ -185,24 +356,46 @@ def download_file(filename):
     else:
         return "File not found", 404
     
-    if file_path.exists():
-        return send_file(file_path, as_attachment=True)
-    else:
+    # send_file stats the file once itself and answers Range and conditional
+    # requests from it, so there's no separate exists() check
+    try:
+        return send_file(file_path, as_attachment=True, conditional=True, etag=True)
+    except FileNotFoundError:
         return "File not found", 404
 
 
-@app.route('/debug')
-def debug_info():
-    """Debug route to check content loading"""
-    return {
-        'docs_available': docs_available,
+def _render_debug(state: SimpleNamespace) -> bytes:
+    """Serialize the /debug payload for a docs state, as jsonify would"""
+    docs_content = state.docs_content
+    diagram_content = state.diagram_content
+    payload = {
+        'docs_available': state.docs_available,
         'docs_content_length': len(docs_content) if docs_content else 0,
         'diagram_content_length': len(diagram_content) if diagram_content else 0,
-        'html_content_length': len(html_content) if html_content else 0,
-        'html_available': bool(html_content),
+        'html_content_length': state.html_size,
+        'html_available': bool(state.html_size),
         'docs_preview': docs_content[:200] + '...' if docs_content else 'No content',
         'diagram_preview': diagram_content[:200] + '...' if diagram_content else 'No content'
     }
+    return (json.dumps(payload, sort_keys=True, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+@app.route('/debug')
+def debug_info():
+    """Debug route to check content loading"""
+    state = docs_state
+    return _conditional(Response(state.debug_json, mimetype='application/json'), state.etags['debug'])
+
+
+def _relay(upstream):
+    """Yield the upstream body in chunks, closing the response however the relay ends"""
+    try:
+        yield from upstream.iter_content(chunk_size=8192)
+    finally:
+        # Runs on completion and when the client disconnects, as the WSGI server
+        # closes the iterable, so the pooled connection is always given back
+        upstream.close()
+
 
 @app.route('/ask', methods=['POST'])
 def ask_question():
@@ -214,17 +407,14 @@ def ask_question():
         if not question:
             return jsonify({'error': 'Question is required'}), 400
         
-        if not docs_available:
+        state = docs_state
+        if not state.docs_available:
             return jsonify({'error': 'No documentation available. Please generate docs first.'}), 400
         
-        # Combine docs and diagram content
-        combined_docs = f"{docs_content}\n\n{diagram_content}"
-        
-        # Prepare request to hosted API
-        api_payload = {
-            'question': question,
-            'docs': combined_docs
-        }
+        # Prepare request to hosted API; only the question is encoded per request,
+        # the docs were serialized by load_docs()
+        api_payload = b''.join((b'{"question": ', json.dumps(question).encode('utf-8'),
+                                b', "docs": ', state.combined_docs_json, b'}'))
         
         # API URL - Replace with your deployed Django AI Wiki API URL
         api_url = "http://localhost:3000/api/chat"
@@ -236,16 +426,21 @@ def ask_question():
 
         # Try to make request to hosted API, fall back to mock response
         try:
-            response = requests.post(
+            response = API_SESSION.post(
                 api_url,
-                json=api_payload,
-                timeout=30,  # Increased timeout for AI processing
-                headers=headers
+                data=api_payload,
+                timeout=ASK_TIMEOUT,
+                headers=headers,
+                stream=True
             )
 
             if response.status_code == 200:
-                return jsonify(response.json())
+                # Relay the answer as it arrives instead of buffering, decoding and
+                # re-encoding it
+                return Response(_relay(response),
+                                content_type=response.headers.get('Content-Type', 'application/json'))
             else:
+                response.close()
                 print(f"API request failed with status {response.status_code}, using mock response")
                 raise requests.RequestException("API unavailable")
 
@@ -255,7 +450,7 @@ def ask_question():
                 'answer': f"**Mock Response** (API unavailable)\n\n"
                          f"Your question: '{question}'\n\n"
                          f"This is a demonstration response. In production, this would be processed by an AI model "
-                         f"with access to your Django documentation ({len(combined_docs)} characters). "
+                         f"with access to your Django documentation ({len(state.combined_docs)} characters). "
                          f"To enable real AI responses, configure the hosted API endpoint in the server.py file."
             }
         
@@ -265,15 +460,28 @@ def ask_question():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
-def start_server(port=8000):
-    """Start the Flask development server"""
+def start_server(port=8000, debug=False):
+    """Start the docs server, on waitress when it's installed"""
     load_docs()
     
     # Open browser automatically
     webbrowser.open(f'http://localhost:{port}')
     
-    # Start Flask server
-    app.run(host='0.0.0.0', port=port, debug=False)
+    if not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            serve = None
+        if serve is not None:
+            # Production WSGI server: keep-alive, a fixed pool of worker threads
+            serve(app, host='0.0.0.0', port=port, threads=16)
+            return
+
+    # Start Flask server; each request gets its own thread, so a slow /ask
+    # call doesn't block the dashboard and docs routes. The Werkzeug debugger
+    # runs arbitrary code, so in debug mode only local clients can reach it
+    host = '127.0.0.1' if debug else '0.0.0.0'
+    app.run(host=host, port=port, debug=debug, threaded=True, use_reloader=False)
 
 
 # HTML Template with Tailwind CSS and Mermaid.js
@@ -586,3 +794,6 @@ HTML_TEMPLATE = """
 </body>
 </html>
 """
+
+# Compiled once; render_template_string would re-parse the source on every request
+COMPILED_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
@@ -0,0 +1,36 @@
+
+from rest_framework import serializers
+from .models import Category, Post, Comment
+
+class CategorySerializer(serializers.ModelSerializer):
+    """Serializer for blog categories"""
+    
+    class Meta:
+        model = Category
+        fields = ['id', 'name', 'slug', 'description', 'created_at']
+        read_only_fields = ['created_at']
+
+class PostSerializer(serializers.ModelSerializer):
+    """Serializer for blog posts"""
+    author_name = serializers.CharField(source='author.username', read_only=True)
+    category_name = serializers.CharField(source='category.name', read_only=True)
+    word_count = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Post
+        fields = ['id', 'title', 'slug', 'author', 'author_name', 'category', 
+                 'category_name', 'content', 'excerpt', 'published', 
+                 'created_at', 'updated_at', 'word_count']
+        read_only_fields = ['created_at', 'updated_at']
+    
+    def get_word_count(self, obj):
+        return obj.get_word_count()
+
+class CommentSerializer(serializers.ModelSerializer):
+    """Serializer for blog comments"""
+    author_name = serializers.CharField(source='author.username', read_only=True)
+    
+    class Meta:
+        model = Comment
+        fields = ['id', 'post', 'author', 'author_name', 'content', 'created_at', 'approved']
+        read_only_fields = ['created_at']
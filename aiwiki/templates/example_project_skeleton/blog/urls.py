@@ -0,0 +1,13 @@
+
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from . import views
+
+router = DefaultRouter()
+router.register(r'categories', views.CategoryViewSet)
+router.register(r'posts', views.PostViewSet)
+router.register(r'comments', views.CommentViewSet)
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
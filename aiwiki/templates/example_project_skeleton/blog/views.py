@@ -0,0 +1,39 @@
+
+from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .models import Category, Post, Comment
+from .serializers import CategorySerializer, PostSerializer, CommentSerializer
+
+class CategoryViewSet(viewsets.ModelViewSet):
+    """ViewSet for managing blog categories"""
+    queryset = Category.objects.all()
+    serializer_class = CategorySerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+class PostViewSet(viewsets.ModelViewSet):
+    """ViewSet for managing blog posts"""
+    queryset = Post.objects.all()
+    serializer_class = PostSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    
+    @action(detail=True, methods=['get'])
+    def comments(self, request, pk=None):
+        """Get comments for a specific post"""
+        post = self.get_object()
+        comments = Comment.objects.filter(post=post, approved=True)
+        serializer = CommentSerializer(comments, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def published(self, request):
+        """Get only published posts"""
+        published_posts = Post.objects.filter(published=True)
+        serializer = self.get_serializer(published_posts, many=True)
+        return Response(serializer.data)
+
+class CommentViewSet(viewsets.ModelViewSet):
+    """ViewSet for managing blog comments"""
+    queryset = Comment.objects.all()
+    serializer_class = CommentSerializer
+    permission_classes = [permissions.IsAuthenticated]
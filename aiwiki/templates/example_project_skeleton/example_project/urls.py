@@ -0,0 +1,9 @@
+
+from django.contrib import admin
+from django.urls import path, include
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('api/blog/', include('blog.urls')),
+    path('api/shop/', include('shop.urls')),
+]
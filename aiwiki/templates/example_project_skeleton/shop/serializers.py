@@ -0,0 +1,11 @@
+
+from rest_framework import serializers
+from .models import Product
+
+class ProductSerializer(serializers.ModelSerializer):
+    """Serializer for products"""
+    
+    class Meta:
+        model = Product
+        fields = '__all__'
+        read_only_fields = ['created_at']
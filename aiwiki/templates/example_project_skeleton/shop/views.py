@@ -0,0 +1,9 @@
+
+from rest_framework import viewsets
+from .models import Product
+from .serializers import ProductSerializer
+
+class ProductViewSet(viewsets.ModelViewSet):
+    """ViewSet for managing products"""
+    queryset = Product.objects.all()
+    serializer_class = ProductSerializer
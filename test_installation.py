@@ -3,56 +3,57 @@
 Test script to verify AI Wiki installation and basic functionality
 """
 
+import contextlib
+import io
 import sys
 import os
+import subprocess
 import tempfile
 import shutil
 from pathlib import Path
 
+# Import everything once; the tests below use these names instead of re-importing
+try:
+    import aiwiki
+    from aiwiki.analyzer import DjangoAnalyzer
+    from aiwiki.generators import MarkdownGenerator, MermaidGenerator
+    from aiwiki.server import app
+    from aiwiki.cli import build_parser
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
 def test_imports():
     """Test that all modules can be imported"""
     print("🧪 Testing imports...")
     
-    try:
-        import aiwiki
-        print("✅ aiwiki package imported successfully")
-        
-        from aiwiki.analyzer import DjangoAnalyzer
-        print("✅ DjangoAnalyzer imported successfully")
-        
-        from aiwiki.generators import MarkdownGenerator, MermaidGenerator
-        print("✅ Generators imported successfully")
-        
-        from aiwiki.server import app
-        print("✅ Flask server imported successfully")
-        
-        from aiwiki.cli import main
-        print("✅ CLI module imported successfully")
-        
-        return True
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
+    if IMPORT_ERROR is not None:
+        print(f"❌ Import error: {IMPORT_ERROR}")
         return False
+    
+    print("✅ aiwiki package imported successfully")
+    print(f"✅ {DjangoAnalyzer.__name__} imported successfully")
+    print("✅ Generators imported successfully")
+    print("✅ Flask server imported successfully")
+    print("✅ CLI module imported successfully")
+    return True
 
 def test_cli_help():
     """Test CLI help functionality"""
     print("\n🧪 Testing CLI help...")
     
     try:
-        from aiwiki.cli import main
-        import argparse
-        
-        # This would normally call sys.exit, so we'll just test the parser creation
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers(dest='command')
-        
-        # Test that we can create the parsers without errors
-        generate_parser = subparsers.add_parser('generate')
-        generate_parser.add_argument('--target', required=True)
-        generate_parser.add_argument('--settings', required=True)
+        # Parse against the real CLI parser; --help would call sys.exit
+        parser = build_parser()
+        args = parser.parse_args(['generate', '--target', '.', '--settings', 'x.settings'])
+        if args.command != 'generate' or args.target != '.' or args.settings != 'x.settings':
+            print("❌ generate arguments parsed incorrectly")
+            return False
         
-        serve_parser = subparsers.add_parser('serve')
-        serve_parser.add_argument('--port', type=int, default=8000)
+        args = parser.parse_args(['serve'])
+        if args.command != 'serve' or args.port != 8000:
+            print("❌ serve arguments parsed incorrectly")
+            return False
         
         print("✅ CLI argument parsing works correctly")
         return True
@@ -60,42 +61,41 @@ def test_cli_help():
         print(f"❌ CLI test error: {e}")
         return False
 
+# Analysis data for test_generators. The generators only read it (interning
+# replaces strings with equal ones), so one shared instance is safe to reuse.
+_MOCK_DATA = {
+    'models': {
+        'blog': {
+            'Post': {
+                'name': 'Post',
+                'app': 'blog',
+                'table_name': 'blog_post',
+                'fields': {
+                    'title': {'type': 'CharField', 'null': False, 'blank': False, 'unique': False, 'help_text': ''},
+                    'content': {'type': 'TextField', 'null': False, 'blank': False, 'unique': False, 'help_text': ''}
+                },
+                'relationships': {},
+                'methods': [],
+                'docstring': 'Blog post model'
+            }
+        }
+    },
+    'serializers': {},
+    'views': {},
+    'project_info': {
+        'path': '/test/project',
+        'settings': 'test.settings',
+        'apps': ['blog']
+    }
+}
+
 def test_generators():
     """Test documentation generators with mock data"""
     print("\n🧪 Testing generators...")
     
     try:
-        from aiwiki.generators import MarkdownGenerator, MermaidGenerator
-        
-        # Mock analysis data
-        mock_data = {
-            'models': {
-                'blog': {
-                    'Post': {
-                        'name': 'Post',
-                        'app': 'blog',
-                        'table_name': 'blog_post',
-                        'fields': {
-                            'title': {'type': 'CharField', 'null': False, 'blank': False, 'unique': False, 'help_text': ''},
-                            'content': {'type': 'TextField', 'null': False, 'blank': False, 'unique': False, 'help_text': ''}
-                        },
-                        'relationships': {},
-                        'methods': [],
-                        'docstring': 'Blog post model'
-                    }
-                }
-            },
-            'serializers': {},
-            'views': {},
-            'project_info': {
-                'path': '/test/project',
-                'settings': 'test.settings',
-                'apps': ['blog']
-            }
-        }
-        
         # Test markdown generator
-        md_gen = MarkdownGenerator(mock_data)
+        md_gen = MarkdownGenerator(_MOCK_DATA)
         markdown_content = md_gen.generate_full_documentation()
         
         if len(markdown_content) > 100 and "Blog post model" in markdown_content:
@@ -105,7 +105,7 @@ def test_generators():
             return False
         
         # Test Mermaid generator
-        mermaid_gen = MermaidGenerator(mock_data)
+        mermaid_gen = MermaidGenerator(_MOCK_DATA)
         diagram_content = mermaid_gen.generate_erd()
         
         if "```mermaid" in diagram_content and "erDiagram" in diagram_content:
@@ -119,24 +119,29 @@ def test_generators():
         print(f"❌ Generator test error: {e}")
         return False
 
+# Routes test_flask_app expects to answer 200 even when no docs have been generated
+FLASK_ROUTES = [
+    ('/', "Dashboard"),
+    ('/debug', "Debug"),
+]
+
 def test_flask_app():
     """Test Flask app creation"""
     print("\n🧪 Testing Flask app...")
     
     try:
-        from aiwiki.server import app
-        
         # Test that app is created
         if app and hasattr(app, 'test_client'):
             print("✅ Flask app created successfully")
             
-            # Test basic route
+            # Probe the routes that work without generated docs, through one client
             with app.test_client() as client:
-                response = client.get('/')
-                if response.status_code == 200:
-                    print("✅ Dashboard route responds correctly")
-                else:
-                    print(f"⚠️  Dashboard route returned status {response.status_code}")
+                for route, label in FLASK_ROUTES:
+                    response = client.get(route)
+                    if response.status_code == 200:
+                        print(f"✅ {label} route responds correctly")
+                    else:
+                        print(f"⚠️  {label} route returned status {response.status_code}")
             
             return True
         else:
@@ -146,6 +151,54 @@ def test_flask_app():
         print(f"❌ Flask test error: {e}")
         return False
 
+def write_summary(text):
+    """Write text to stdout with a single os.write, after what print() has buffered"""
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # stdout replaced by an in-memory stream
+        sys.stdout.write(text)
+        return
+    data = text.encode(sys.stdout.encoding or "utf-8", "replace")
+    while data:
+        data = data[os.write(fd, data):]
+
+def test_cached_generate():
+    """Test that a second generate, served from the analysis cache, still succeeds"""
+    print("\n🧪 Testing cached generate...")
+    
+    try:
+        from example_usage import create_example_django_project
+        
+        # Each run is a fresh process, so the cached run renders without Django set up
+        env = dict(os.environ,
+                   PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(aiwiki.__file__))),
+                   AIWIKI_API_URL='http://127.0.0.1:9/api/projects')
+        command = [sys.executable, '-m', 'aiwiki.cli', 'generate',
+                   '--target', '.', '--settings', 'example_project.settings']
+        
+        with tempfile.TemporaryDirectory(prefix="aiwiki_test_") as temp_dir:
+            # Keep the example's scaffolding banner out of the test output
+            with contextlib.redirect_stdout(io.StringIO()):
+                project_dir = create_example_django_project(temp_dir)
+            for run in ("first", "cached"):
+                result = subprocess.run(command, cwd=project_dir, env=env,
+                                        capture_output=True, text=True)
+                if result.returncode != 0:
+                    last_line = (result.stdout.strip().splitlines() or [f"exit status {result.returncode}"])[-1]
+                    print(f"❌ {run.capitalize()} generate failed: {last_line}")
+                    return False
+            if "using cached analysis" not in result.stdout:
+                print("❌ Second generate did not use the cached analysis")
+                return False
+        
+        print("✅ Generate works with a warm analysis cache")
+        return True
+    except Exception as e:
+        print(f"❌ Cached generate test error: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🚀 AI Wiki Installation Test\n")
@@ -154,28 +207,38 @@ def main():
         test_imports,
         test_cli_help,
         test_generators,
-        test_flask_app
+        test_flask_app,
+        test_cached_generate
     ]
     
     passed = 0
     total = len(tests)
     
+    # Stop at the first failure; later tests depend on what the earlier ones check
     for test in tests:
-        if test():
-            passed += 1
-    
-    print(f"\n📊 Test Results: {passed}/{total} tests passed")
+        if not test():
+            break
+        passed += 1
     
+    summary = ["", f"📊 Test Results: {passed}/{total} tests passed"]
     if passed == total:
-        print("🎉 All tests passed! AI Wiki is ready to use.")
-        print("\n📝 Next steps:")
-        print("1. Create or navigate to a Django project")
-        print("2. Run: aiwiki generate --target . --settings your_project.settings")
-        print("3. Run: aiwiki serve")
-        print("4. Or try the example: python example_usage.py")
+        summary += [
+            "🎉 All tests passed! AI Wiki is ready to use.",
+            "",
+            "📝 Next steps:",
+            "1. Create or navigate to a Django project",
+            "2. Run: aiwiki generate --target . --settings your_project.settings",
+            "3. Run: aiwiki serve",
+            "4. Or try the example: python example_usage.py",
+        ]
     else:
-        print("❌ Some tests failed. Please check your installation.")
-        print("💡 Try: pip install -r requirements.txt")
+        summary += [
+            "❌ Some tests failed. Please check your installation.",
+            "💡 Try: pip install -r requirements.txt",
+        ]
+    write_summary("\n".join(summary) + "\n")
+    
+    if passed != total:
         sys.exit(1)
 
 if __name__ == "__main__":